@@ -0,0 +1,251 @@
+"""Admission control for the expensive analysis endpoints.
+
+Two layers, applied per endpoint class (``video``, ``speech``, ``feedback``):
+
+* a token bucket per user, so one user can't fire requests faster than the
+  class's sustained rate (plus a small burst);
+* a concurrency limit per class with a short FIFO wait queue, so the box
+  never runs more than N analyses of a kind at once.
+
+Requests that run out of tokens, find the queue full or wait too long get
+``429`` with a ``Retry-After`` header.
+
+Token buckets live in a pluggable backend: in process memory by default,
+or Redis (``ADMISSION_BACKEND=redis``) so every worker process shares the
+same per-user budget. The concurrency limit is always per process.
+"""
+import asyncio
+import importlib
+import math
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+from fastapi import Depends, HTTPException, status
+from dotenv import load_dotenv
+
+from auth import get_current_active_user
+from metrics import Counter, Gauge
+from models import User
+
+load_dotenv()
+
+@dataclass(frozen=True)
+class AdmissionPolicy:
+    rate: float          # sustained requests per second per user
+    burst: int           # bucket size
+    concurrency: int     # simultaneous requests per process
+    max_queue: int       # requests allowed to wait for a slot
+    max_wait: float      # seconds a queued request waits before giving up
+
+def _policy(name, rate, burst, concurrency, max_queue, max_wait):
+    prefix = f"ADMISSION_{name.upper()}_"
+    policy = AdmissionPolicy(
+        rate=float(os.getenv(prefix + "RATE", rate)),
+        burst=int(os.getenv(prefix + "BURST", burst)),
+        concurrency=int(os.getenv(prefix + "CONCURRENCY", concurrency)),
+        max_queue=int(os.getenv(prefix + "MAX_QUEUE", max_queue)),
+        max_wait=float(os.getenv(prefix + "MAX_WAIT", max_wait)),
+    )
+    # Fail at startup rather than with a ZeroDivisionError on every request
+    if policy.rate <= 0:
+        raise ValueError(f"{prefix}RATE must be greater than 0, got {policy.rate}")
+    if policy.burst < 1:
+        raise ValueError(f"{prefix}BURST must be at least 1, got {policy.burst}")
+    if policy.concurrency < 1:
+        raise ValueError(f"{prefix}CONCURRENCY must be at least 1, got {policy.concurrency}")
+    if policy.max_queue < 0 or policy.max_wait < 0:
+        raise ValueError(f"{prefix}MAX_QUEUE and {prefix}MAX_WAIT must not be negative")
+    return policy
+
+POLICIES = {
+    "video": _policy("video", rate=0.2, burst=2, concurrency=max(1, (os.cpu_count() or 2) // 2), max_queue=4, max_wait=10),
+    "speech": _policy("speech", rate=1.0, burst=5, concurrency=8, max_queue=16, max_wait=5),
+    "feedback": _policy("feedback", rate=0.1, burst=3, concurrency=4, max_queue=8, max_wait=5),
+}
+
+ADMISSION_DECISIONS = Counter(
+    "interview_ai_admission_decisions_total", "Admission decisions by endpoint class", ["endpoint_class", "decision"]
+)
+ADMISSION_SLOTS = Gauge(
+    "interview_ai_admission_slots", "Running and queued requests per endpoint class", ["endpoint_class", "state"]
+)
+
+class InMemoryTokenBuckets:
+    """Per-process token buckets; the least recently used keys are evicted."""
+
+    def __init__(self, max_keys=100_000):
+        self._buckets = OrderedDict()
+        self._max_keys = max_keys
+
+    async def take(self, key, rate, burst):
+        """Take one token; return 0 if granted, else seconds until one is available."""
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - updated) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    async def refund(self, key, burst):
+        """Give back a token taken for a request that was then not admitted."""
+        entry = self._buckets.get(key)
+        if entry is not None:
+            tokens, updated = entry
+            self._buckets[key] = (min(float(burst), tokens + 1), updated)
+
+class RedisTokenBuckets:
+    """Token buckets shared by every process through Redis (needs ``redis``)."""
+
+    SCRIPT = """
+    local rate = tonumber(ARGV[1])
+    local burst = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or burst
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+    local wait = 0
+    if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+    return tostring(wait)
+    """
+    REFUND_SCRIPT = """
+    local burst = tonumber(ARGV[1])
+    local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+    if tokens then redis.call('HSET', KEYS[1], 'tokens', math.min(burst, tokens + 1)) end
+    return 0
+    """
+
+    def __init__(self, url=None, prefix="admission:"):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url or os.getenv("ADMISSION_REDIS_URL", "redis://localhost:6379/0"))
+        self._script = self._redis.register_script(self.SCRIPT)
+        self._refund_script = self._redis.register_script(self.REFUND_SCRIPT)
+        self._prefix = prefix
+
+    async def take(self, key, rate, burst):
+        wait = await self._script(keys=[self._prefix + key], args=[rate, burst, time.time()])
+        return float(wait)
+
+    async def refund(self, key, burst):
+        await self._refund_script(keys=[self._prefix + key], args=[burst])
+
+def load_backend():
+    """``ADMISSION_BACKEND``: ``memory`` (default), ``redis`` or ``package.module:Class``
+    (an object with async ``take(key, rate, burst)`` and ``refund(key, burst)``)."""
+    name = os.getenv("ADMISSION_BACKEND", "memory")
+    if name == "memory":
+        return InMemoryTokenBuckets()
+    if name == "redis":
+        return RedisTokenBuckets()
+    module_name, _, class_name = name.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+class ConcurrencyLimiter:
+    """At most ``limit`` holders at once, with a bounded FIFO wait queue."""
+
+    def __init__(self, limit, max_queue, max_wait):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.active = 0
+        self._waiters = deque()
+        # Smoothed time a slot is held, used to estimate Retry-After
+        self._hold_seconds = 1.0
+
+    @property
+    def queued(self):
+        return len(self._waiters)
+
+    def retry_after(self):
+        return max(1, math.ceil(self._hold_seconds * (self.queued + 1) / self.limit))
+
+    async def acquire(self):
+        """Return once a slot is held; raise ``asyncio.TimeoutError`` if the
+        wait exceeds ``max_wait`` and ``OverflowError`` if the queue is full."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            raise OverflowError("admission queue full")
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.max_wait)
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up; pass it on
+                self.release()
+            else:
+                waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self, held_seconds=None):
+        if held_seconds is not None:
+            self._hold_seconds = 0.8 * self._hold_seconds + 0.2 * held_seconds
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Hand the slot straight to the next waiter; ``active`` is unchanged
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+token_buckets = load_backend()
+limiters = {
+    name: ConcurrencyLimiter(policy.concurrency, policy.max_queue, policy.max_wait)
+    for name, policy in POLICIES.items()
+}
+for _name, _limiter in limiters.items():
+    ADMISSION_SLOTS.labels(_name, "running").set_function(lambda limiter=_limiter: limiter.active)
+    ADMISSION_SLOTS.labels(_name, "queued").set_function(lambda limiter=_limiter: limiter.queued)
+
+def _reject(endpoint_class, reason, retry_after, detail):
+    ADMISSION_DECISIONS.labels(endpoint_class, reason).inc()
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+def admission(endpoint_class):
+    """Dependency factory: ``Depends(admission("video"))`` holds a slot of
+    that class for the duration of the request."""
+    policy = POLICIES[endpoint_class]
+    limiter = limiters[endpoint_class]
+
+    async def admit(current_user: User = Depends(get_current_active_user)):
+        key = f"{endpoint_class}:{current_user.id}"
+        wait = await token_buckets.take(key, policy.rate, policy.burst)
+        if wait > 0:
+            _reject(endpoint_class, "rate_limited", wait, "Too many requests, please slow down")
+        try:
+            await limiter.acquire()
+        except (OverflowError, asyncio.TimeoutError) as e:
+            # Not admitted because the server is busy: don't charge the user for it
+            await token_buckets.refund(key, policy.burst)
+            reason = "queue_full" if isinstance(e, OverflowError) else "queue_timeout"
+            _reject(endpoint_class, reason, limiter.retry_after(), "Server busy, please retry later")
+
+        ADMISSION_DECISIONS.labels(endpoint_class, "admitted").inc()
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            limiter.release(time.monotonic() - started)
+
+    return admit
@@ -1,40 +1,52 @@
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 import os
 
-from database import get_db
+from database import get_async_db
 from models import User
 from schemas import TokenData
+from hashing import hash_password, verify_and_update_password
 
 # JWT Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-for-development")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# Password context for hashing and verifying
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Usernames allowed to use admin-only endpoints and tooling (comma-separated).
+# Empty by default: usernames are self-chosen at registration, so admins must
+# be configured explicitly, and only with accounts that already exist.
+ADMIN_USERNAMES = {name.strip() for name in os.getenv("ADMIN_USERNAMES", "").split(",") if name.strip()}
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password, hashed_password):
+    valid, _ = await verify_and_update_password(plain_password, hashed_password)
+    return valid
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    return await hash_password(password)
 
-def get_user(db: Session, username: str):
-    return db.query(User).filter(User.username == username).first()
+async def get_user(db: AsyncSession, username: str):
+    result = await db.execute(select(User).where(User.username == username))
+    return result.scalars().first()
 
-def authenticate_user(db: Session, email: str, password: str):
-    user = db.query(User).filter(User.email == email).first()
+async def authenticate_user(db: AsyncSession, email: str, password: str):
+    result = await db.execute(select(User).where(User.email == email))
+    user = result.scalars().first()
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    valid, new_hash = await verify_and_update_password(password, user.hashed_password)
+    if not valid:
         return False
+    if new_hash:
+        # Stored hash used an outdated bcrypt cost; upgrade it transparently
+        user.hashed_password = new_hash
+        await db.commit()
     return user
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -47,7 +59,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def username_from_token(token: str) -> Optional[str]:
+    """Subject of a valid access token, or None. Does not hit the database."""
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    return payload.get("sub")
+
+def is_admin_username(username: Optional[str]) -> bool:
+    return username is not None and username in ADMIN_USERNAMES
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -61,7 +84,11 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         token_data = TokenData(username=username)
     except JWTError:
         raise credentials_exception
-    user = get_user(db, username=token_data.username)
+    user = await get_user(db, username=token_data.username)
+    # End the lookup's transaction so its pooled connection is returned now,
+    # not held idle through admission queues and long analyses. The session
+    # does not expire on commit, so ``user`` stays usable.
+    await db.commit()
     if user is None:
         raise credentials_exception
     return user
@@ -70,3 +97,8 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+async def get_current_admin_user(current_user: User = Depends(get_current_active_user)):
+    if not is_admin_username(current_user.username):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required")
+    return current_user
@@ -0,0 +1,10 @@
+"""Offline benchmark and load-test suite for the backend.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks --out results.json --baseline baseline.json
+
+Everything runs against synthetic inputs, a throwaway SQLite database and
+local fakes for OpenAI, Google Speech-to-Text and MongoDB, so results are
+reproducible and need no network access or credentials.
+"""
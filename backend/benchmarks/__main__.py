@@ -0,0 +1,132 @@
+"""Run the benchmark suite: ``python -m benchmarks --help`` (from ``backend``)."""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Offline backend benchmarks")
+    parser.add_argument("--out", help="write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="relative slowdown that counts as a regression")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=20, help="micro-benchmark iterations per stage")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--interviews-per-user", type=int, default=50)
+    parser.add_argument("--video-seconds", type=float, default=5.0)
+    parser.add_argument("--audio-seconds", type=float, default=5.0)
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="simulated OpenAI latency (s)")
+    parser.add_argument("--speech-latency", type=float, default=0.02, help="simulated STT seconds per audio second")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--url", help="load-test a running server instead of the in-process app")
+    parser.add_argument("--skip-micro", action="store_true")
+    parser.add_argument("--skip-load", action="store_true")
+    return parser.parse_args()
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+async def run(args, workdir):
+    # Imported here so the environment set up in main() is in place first
+    import main as api
+    from database import async_engine, engine
+    from question_bank import load_question_bank
+
+    from benchmarks.fakes import install_fakes
+    from benchmarks.load import run_load
+    from benchmarks.micro import run_micro
+    from benchmarks.report import peak_rss_mb
+    from benchmarks.synthetic import make_speech_like_pcm, make_talking_head_video, seed_database
+
+    install_fakes(llm_latency=args.llm_latency, speech_latency_per_second=args.speech_latency)
+
+    started = time.perf_counter()
+    seed = seed_database(engine, users=args.users, interviews_per_user=args.interviews_per_user, seed=args.seed)
+    await load_question_bank()
+    context = {
+        "seed": seed,
+        "audio": make_speech_like_pcm(args.audio_seconds, seed=args.seed),
+    }
+    try:
+        video_path = make_talking_head_video(os.path.join(workdir, "talking_head.mp4"), args.video_seconds, seed=args.seed)
+        context["video_path"] = video_path
+        with open(video_path, "rb") as f:
+            context["video_bytes"] = f.read()
+    except Exception as e:
+        print(f"Warning: synthetic video unavailable ({e}); video stages will be skipped", file=sys.stderr)
+    setup_seconds = time.perf_counter() - started
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "args": vars(args),
+            "setup_seconds": setup_seconds,
+        },
+    }
+    if not args.skip_micro:
+        results["micro"] = await run_micro(context, iterations=args.iterations)
+    if not args.skip_load:
+        results["load"] = await run_load(
+            context,
+            app=None if args.url else api.app,
+            base_url=args.url,
+            concurrency=args.concurrency,
+            total_requests=args.requests,
+            seed=args.seed,
+        )
+    results["peak_rss_mb"] = peak_rss_mb()
+
+    await async_engine.dispose()
+    return results
+
+def main():
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="interview-ai-bench-")
+
+    # Throwaway SQLite database and no real external services
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ.setdefault("PROFILE_SAMPLE_RATE", "0")
+    # Per-user rate limits would turn most of a short synthetic run into 429s;
+    # lift them (concurrency limits stay) unless the caller set them explicitly
+    for endpoint_class in ("VIDEO", "SPEECH", "FEEDBACK"):
+        os.environ.setdefault(f"ADMISSION_{endpoint_class}_RATE", "1000")
+        os.environ.setdefault(f"ADMISSION_{endpoint_class}_BURST", "1000")
+
+    results = asyncio.run(run(args, workdir))
+
+    output = json.dumps(results, indent=2, default=str)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(output + "\n")
+        print(f"Results written to {args.out}", file=sys.stderr)
+    else:
+        print(output)
+
+    if args.baseline:
+        from benchmarks.report import compare, print_comparison
+
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline, tolerance=args.tolerance)
+        print_comparison(rows, file=sys.stderr)
+        if any(row["regression"] for row in rows):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Local stand-ins for the external services the backend calls.
+
+Each fake sleeps for a configurable, deterministic amount of time so the
+benchmarks still exercise the concurrency behaviour of real network calls
+without depending on them.
+"""
+import asyncio
+import importlib
+import json
+import time
+from types import SimpleNamespace
+
+class FakeChatCompletion:
+    """Replaces ``openai.ChatCompletion`` as used by ``routers.ai_feedback``."""
+
+    latency_seconds = 0.05
+
+    @classmethod
+    async def create(cls, model, messages, **kwargs):
+        await asyncio.sleep(cls.latency_seconds)
+        system = messages[0]["content"]
+        if "Extract numerical scores" in system:
+            content = json.dumps({"technical": 7, "communication": 8, "confidence": 6})
+        else:
+            content = "Clear structure and good examples. Quantify impact more often. " * 20
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+class FakeSpeechClient:
+    """Replaces ``google.cloud.speech.SpeechClient``; latency scales with audio length."""
+
+    seconds_per_audio_second = 0.02
+    sample_rate = 16000
+
+    def recognize(self, config, audio):
+        audio_seconds = len(audio.content) / 2 / self.sample_rate
+        time.sleep(audio_seconds * self.seconds_per_audio_second)
+        alternative = SimpleNamespace(transcript="this is a synthetic benchmark answer", confidence=0.92)
+        return SimpleNamespace(results=[SimpleNamespace(alternatives=[alternative])])
+
+def speech_sdk_available():
+    """``transcribe_audio`` builds ``RecognitionConfig``/``RecognitionAudio``
+    from the real SDK even when the client is faked."""
+    try:
+        importlib.import_module("google.cloud.speech")
+    except ImportError:
+        return False
+    return True
+
+def install_fakes(llm_latency=None, speech_latency_per_second=None):
+    """Patch the already-imported app modules to use the fakes."""
+    import sys
+
+    import database
+    import openai
+
+    if llm_latency is not None:
+        FakeChatCompletion.latency_seconds = llm_latency
+    if speech_latency_per_second is not None:
+        FakeSpeechClient.seconds_per_audio_second = speech_latency_per_second
+
+    # MongoDB: in-memory mongomock client
+    import mongomock
+    database.mongo_client = mongomock.MongoClient()
+    database.mongo_db = database.mongo_client.interview_ai
+
+    # routers.ai_feedback looks up openai.ChatCompletion at call time
+    openai.ChatCompletion = FakeChatCompletion
+
+    speech_analysis = sys.modules.get("routers.speech_analysis")
+    if speech_analysis is not None:
+        speech_analysis._speech_client = FakeSpeechClient()
+        speech_analysis._speech_client_initialized = True
@@ -0,0 +1,131 @@
+"""Concurrent HTTP load test against the app (in-process or a live server)."""
+import asyncio
+import base64
+import random
+import time
+from collections import defaultdict
+
+from benchmarks.micro import summarize
+from benchmarks.synthetic import BENCHMARK_PASSWORD
+
+async def _list_interviews(client, ctx, user, rng):
+    return await client.get("/interviews/", headers=user["headers"])
+
+async def _interview_full(client, ctx, user, rng):
+    interview_id = rng.choice(user["interviews"])
+    return await client.get(f"/interviews/{interview_id}/full", headers=user["headers"])
+
+async def _login(client, ctx, user, rng):
+    return await client.post("/users/token", data={"username": user["email"], "password": BENCHMARK_PASSWORD})
+
+async def _transcribe(client, ctx, user, rng):
+    return await client.post("/speech-analysis/transcribe", json={"audio_base64": ctx["audio_base64"]}, headers=user["headers"])
+
+async def _generate_feedback(client, ctx, user, rng):
+    interview_id = rng.choice(user["interviews"])
+    return await client.post(f"/ai-feedback/generate?interview_id={interview_id}", headers=user["headers"])
+
+async def _analyze_video(client, ctx, user, rng):
+    return await client.post("/video-analysis/analyze", json={"video_base64": ctx["video_base64"]}, headers=user["headers"])
+
+# (name, relative weight, request function, route prefix that must be mounted)
+SCENARIOS = [
+    ("list_interviews", 30, _list_interviews, "/interviews"),
+    ("interview_full", 25, _interview_full, "/interviews"),
+    ("login", 5, _login, "/users"),
+    ("transcribe", 10, _transcribe, "/speech-analysis"),
+    ("generate_feedback", 5, _generate_feedback, "/ai-feedback"),
+    ("analyze_video", 2, _analyze_video, "/video-analysis"),
+]
+
+def _available_scenarios(app, ctx):
+    if app is None:
+        return SCENARIOS
+    from benchmarks.fakes import speech_sdk_available
+    paths = {getattr(route, "path", "") for route in app.routes}
+    scenarios = []
+    for scenario in SCENARIOS:
+        name, _, _, prefix = scenario
+        if not any(path.startswith(prefix) for path in paths):
+            continue
+        if name == "analyze_video" and not ctx.get("video_base64"):
+            continue
+        # The router builds its request objects from the real SDK types
+        if name == "transcribe" and not speech_sdk_available():
+            continue
+        scenarios.append(scenario)
+    return scenarios
+
+async def run_load(ctx, app=None, base_url=None, concurrency=16, total_requests=500, seed=0, timeout=120.0):
+    """Fire ``total_requests`` requests from ``concurrency`` workers using a
+    seeded weighted scenario mix. Pass ``app`` to drive it in-process
+    (no sockets) or ``base_url`` to load a running server."""
+    import httpx
+    from auth import create_access_token
+
+    users = [
+        {
+            "email": email,
+            "headers": {"Authorization": f"Bearer {create_access_token({'sub': username})}"},
+            "interviews": ctx["seed"]["interviews"][user_id],
+        }
+        for user_id, username, email in ctx["seed"]["users"]
+    ]
+    ctx = {
+        **ctx,
+        "audio_base64": base64.b64encode(ctx["audio"]).decode(),
+        "video_base64": base64.b64encode(ctx["video_bytes"]).decode() if ctx.get("video_bytes") else None,
+    }
+    scenarios = _available_scenarios(app, ctx)
+    weights = [weight for _, weight, _, _ in scenarios]
+
+    if app is not None:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark", timeout=timeout)
+    else:
+        client = httpx.AsyncClient(base_url=base_url, timeout=timeout)
+
+    latencies = defaultdict(list)
+    statuses = defaultdict(lambda: defaultdict(int))
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index
+        while next_index < total_requests:
+            index = next_index
+            next_index += 1
+            rng = random.Random(seed * 1_000_003 + index)
+            name, _, request, _ = rng.choices(scenarios, weights=weights)[0]
+            user = rng.choice(users)
+            start = time.perf_counter()
+            try:
+                response = await request(client, ctx, user, rng)
+                status = str(response.status_code)
+            except Exception as e:
+                # Transport errors, and in-process also exceptions the app raised
+                # (ASGITransport re-raises them): count as an error, keep going
+                status = type(e).__name__
+            latencies[name].append(time.perf_counter() - start)
+            statuses[name][status] += 1
+
+    async with client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    errors = sum(
+        count for by_status in statuses.values() for status, count in by_status.items()
+        if not status.startswith("2")
+    )
+    return {
+        "concurrency": concurrency,
+        "requests": total_requests,
+        "elapsed_seconds": elapsed,
+        "throughput_rps": total_requests / elapsed if elapsed > 0 else None,
+        "error_rate": errors / total_requests if total_requests else 0.0,
+        "overall": summarize(all_latencies) if all_latencies else {},
+        "scenarios": {
+            name: {**summarize(values), "statuses": dict(statuses[name])}
+            for name, values in sorted(latencies.items())
+        },
+    }
@@ -0,0 +1,66 @@
+"""Result bookkeeping: peak RSS and comparison against a saved baseline."""
+import math
+import resource
+import sys
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def _flatten(results):
+    """``{metric_name: (value, higher_is_better)}`` for everything comparable."""
+    metrics = {}
+    for stage, summary in results.get("micro", {}).items():
+        if "p50_seconds" in summary:
+            metrics[f"micro.{stage}.p50_seconds"] = (summary["p50_seconds"], False)
+            metrics[f"micro.{stage}.p95_seconds"] = (summary["p95_seconds"], False)
+    load = results.get("load") or {}
+    if load.get("throughput_rps"):
+        metrics["load.throughput_rps"] = (load["throughput_rps"], True)
+        metrics["load.error_rate"] = (load["error_rate"], False)
+    for key in ("p50_seconds", "p95_seconds", "p99_seconds"):
+        if key in load.get("overall", {}):
+            metrics[f"load.overall.{key}"] = (load["overall"][key], False)
+    for name, summary in load.get("scenarios", {}).items():
+        metrics[f"load.{name}.p95_seconds"] = (summary["p95_seconds"], False)
+    if "peak_rss_mb" in results:
+        metrics["peak_rss_mb"] = (results["peak_rss_mb"], False)
+    return metrics
+
+def compare(current, baseline, tolerance=0.10):
+    """Rows for every metric present in both runs. A metric regresses when
+    it is worse than the baseline by more than ``tolerance`` (relative)."""
+    current_metrics = _flatten(current)
+    baseline_metrics = _flatten(baseline)
+    rows = []
+    for name, (value, higher_is_better) in current_metrics.items():
+        if name not in baseline_metrics:
+            continue
+        base = baseline_metrics[name][0]
+        if base:
+            change = (value - base) / base
+        else:
+            # Nothing to scale against (typically error_rate 0): any increase
+            # is infinitely worse, so it always counts when higher is worse
+            change = math.inf if value > base else 0.0
+        worse = -change if higher_is_better else change
+        rows.append({
+            "metric": name,
+            "baseline": base,
+            "current": value,
+            "change": change,
+            "regression": worse > tolerance,
+        })
+    return rows
+
+def print_comparison(rows, file=sys.stdout):
+    width = max((len(row["metric"]) for row in rows), default=10)
+    print(f"{'metric':<{width}}  {'baseline':>12}  {'current':>12}  {'change':>8}", file=file)
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['metric']:<{width}}  {row['baseline']:>12.6g}  {row['current']:>12.6g}  "
+            f"{row['change'] * 100:>+7.1f}%{flag}",
+            file=file,
+        )
@@ -0,0 +1,159 @@
+"""Deterministic synthetic inputs: video, audio and a seeded database."""
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+def make_talking_head_video(path, seconds=5.0, fps=30, width=640, height=480, seed=0):
+    """Write an mp4 of a cartoon face that sways, blinks and "talks".
+
+    It is not a real face, but it gives the decoder realistic frame sizes and
+    motion, and gives FaceMesh/DeepFace a face-like region to work on.
+    """
+    import cv2
+
+    rng = np.random.default_rng(seed)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+    if not writer.isOpened():
+        raise RuntimeError("cv2.VideoWriter could not open an mp4v stream")
+
+    background = rng.integers(90, 140, size=(height, width, 3), dtype=np.uint8)
+    frames = int(seconds * fps)
+    for index in range(frames):
+        t = index / fps
+        frame = background.copy()
+        cx = int(width / 2 + 12 * np.sin(2 * np.pi * 0.3 * t))
+        cy = int(height / 2 + 6 * np.sin(2 * np.pi * 0.5 * t))
+        face_w, face_h = width // 6, height // 4
+
+        cv2.ellipse(frame, (cx, cy), (face_w, face_h), 0, 0, 360, (150, 180, 225), -1)
+        # Blink for ~150 ms every 3 s
+        eye_h = 2 if (t % 3.0) < 0.15 else 9
+        for dx in (-face_w // 2.5, face_w // 2.5):
+            eye = (int(cx + dx), cy - face_h // 4)
+            cv2.ellipse(frame, eye, (14, eye_h), 0, 0, 360, (255, 255, 255), -1)
+            cv2.circle(frame, eye, min(eye_h, 6), (40, 30, 20), -1)
+        # Mouth opens and closes at a syllable-like rate
+        mouth_open = int(4 + 14 * abs(np.sin(2 * np.pi * 2.2 * t)))
+        cv2.ellipse(frame, (cx, cy + face_h // 2), (face_w // 3, mouth_open), 0, 0, 360, (60, 40, 120), -1)
+        # Sensor noise so frames don't compress to nothing
+        noise = rng.integers(-6, 7, size=frame.shape, dtype=np.int16)
+        frame = np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+        writer.write(frame)
+
+    writer.release()
+    return path
+
+def make_speech_like_pcm(seconds=5.0, sample_rate=16000, seed=0):
+    """16-bit mono PCM (LINEAR16) with a voiced, syllable-modulated signal."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+
+    # Gliding pitch around 120 Hz with a few harmonics shaped like formants
+    pitch = 120 + 20 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(amplitude * np.sin(harmonic * phase) for harmonic, amplitude in ((1, 1.0), (2, 0.6), (3, 0.4), (5, 0.25), (8, 0.1)))
+
+    # ~4 syllables per second with short pauses between phrases
+    syllables = np.clip(np.sin(2 * np.pi * 4 * t), 0, None) ** 2
+    phrases = (np.sin(2 * np.pi * 0.25 * t) > -0.7).astype(float)
+    signal = voiced * syllables * phrases + 0.02 * rng.standard_normal(t.shape)
+
+    signal = signal / np.max(np.abs(signal)) * 0.6
+    return (signal * 32767).astype("<i2").tobytes()
+
+BENCHMARK_PASSWORD = "benchmark-password"
+
+def seed_database(engine, users=20, interviews_per_user=50, questions_per_interview=10, seed=0):
+    """Create the schema and fill it with users, interviews, questions,
+    answers and feedback. Returns the seeded user/interview ids."""
+    from database import Base
+    from hashing import pwd_context
+    from models import User, Interview, InterviewQuestion, InterviewAnswer, InterviewFeedback, QuestionBankItem
+    from sqlalchemy import insert
+
+    rng = random.Random(seed)
+    Base.metadata.create_all(bind=engine)
+
+    # Every user shares one hash so seeding doesn't spend minutes in bcrypt
+    hashed_password = pwd_context.hash(BENCHMARK_PASSWORD)
+    now = datetime.now(timezone.utc)
+    interview_types = ("technical", "behavioral", "hr")
+
+    user_rows, interview_rows, question_rows, answer_rows, feedback_rows = [], [], [], [], []
+    interviews_by_user = {}
+    for u in range(users):
+        user_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        user_rows.append({
+            "id": user_id,
+            "email": f"bench{u}@example.com",
+            "username": f"bench{u}",
+            "hashed_password": hashed_password,
+            "is_active": True,
+        })
+        for i in range(interviews_per_user):
+            interview_id = str(uuid.UUID(int=rng.getrandbits(128)))
+            created_at = now - timedelta(hours=i, minutes=u)
+            interviews_by_user.setdefault(user_id, []).append(interview_id)
+            interview_rows.append({
+                "id": interview_id,
+                "user_id": user_id,
+                "interview_type": rng.choice(interview_types),
+                "status": "completed",
+                "created_at": created_at,
+            })
+            for q in range(questions_per_interview):
+                question_id = str(uuid.UUID(int=rng.getrandbits(128)))
+                question_rows.append({
+                    "id": question_id,
+                    "interview_id": interview_id,
+                    "question_text": f"Benchmark question {q} for interview {i}",
+                    "question_order": q + 1,
+                    "created_at": created_at,
+                })
+                answer_rows.append({
+                    "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "question_id": question_id,
+                    "answer_text": " ".join(rng.choice(("I", "would", "design", "cache", "index", "the", "service", "scale")) for _ in range(60)),
+                    "created_at": created_at,
+                })
+            feedback_rows.append({
+                "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "interview_id": interview_id,
+                "feedback_text": "Solid answers overall.",
+                "technical_score": rng.uniform(4, 10),
+                "communication_score": rng.uniform(4, 10),
+                "confidence_score": rng.uniform(4, 10),
+                "created_at": created_at,
+            })
+
+    bank_rows = [
+        {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "interview_type": interview_type,
+            "difficulty": difficulty,
+            "question_text": f"{interview_type} {difficulty} question {n}",
+            "is_active": True,
+        }
+        for interview_type in interview_types
+        for difficulty in ("easy", "medium", "hard")
+        for n in range(20)
+    ]
+
+    with engine.begin() as connection:
+        for model, rows in (
+            (User, user_rows),
+            (Interview, interview_rows),
+            (InterviewQuestion, question_rows),
+            (InterviewAnswer, answer_rows),
+            (InterviewFeedback, feedback_rows),
+            (QuestionBankItem, bank_rows),
+        ):
+            if rows:
+                connection.execute(insert(model), rows)
+
+    return {
+        "users": [(row["id"], row["username"], row["email"]) for row in user_rows],
+        "interviews": interviews_by_user,
+    }
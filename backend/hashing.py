@@ -0,0 +1,101 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from dotenv import load_dotenv
+
+from metrics import Counter, Gauge
+
+load_dotenv()
+
+# bcrypt cost factor. Raising it makes existing hashes "deprecated" and they are
+# transparently re-hashed the next time their owner logs in.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Hashing runs on its own small pool so a burst of logins cannot starve
+# FastAPI's shared threadpool (and with it every other sync endpoint).
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="password-hash")
+_lock = threading.Lock()
+_stats = {
+    "queued": 0,
+    "running": 0,
+    "completed": 0,
+    "rejected": 0,
+    "rehashed": 0,
+    "wait_seconds_total": 0.0,
+    "run_seconds_total": 0.0,
+}
+
+def hash_executor_stats():
+    """Snapshot of the password hashing queue, e.g. for a metrics endpoint."""
+    with _lock:
+        stats = dict(_stats)
+    stats["workers"] = HASH_WORKERS
+    stats["max_queue"] = HASH_MAX_QUEUE
+    return stats
+
+def _run_timed(fn, submitted_at, *args):
+    started_at = time.perf_counter()
+    with _lock:
+        _stats["queued"] -= 1
+        _stats["running"] += 1
+        _stats["wait_seconds_total"] += started_at - submitted_at
+    try:
+        return fn(*args)
+    finally:
+        with _lock:
+            _stats["running"] -= 1
+            _stats["completed"] += 1
+            _stats["run_seconds_total"] += time.perf_counter() - started_at
+
+async def _submit(fn, *args):
+    with _lock:
+        if _stats["queued"] >= HASH_MAX_QUEUE:
+            _stats["rejected"] += 1
+            full = True
+        else:
+            _stats["queued"] += 1
+            full = False
+    if full:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent authentication requests, please retry",
+            headers={"Retry-After": "1"},
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, _run_timed, fn, time.perf_counter(), *args)
+
+async def hash_password(password: str) -> str:
+    return await _submit(pwd_context.hash, password)
+
+async def verify_and_update_password(password: str, hashed_password: str):
+    """Return ``(valid, new_hash)``; ``new_hash`` is set when the stored hash
+    uses outdated settings (e.g. a lower ``BCRYPT_ROUNDS``) and should be saved."""
+    valid, new_hash = await _submit(pwd_context.verify_and_update, password, hashed_password)
+    if new_hash is not None:
+        with _lock:
+            _stats["rehashed"] += 1
+    return valid, new_hash
+
+_hash_queue_gauge = Gauge(
+    "interview_ai_password_hash_tasks", "Password hashing tasks currently queued or running", ["state"]
+)
+for _state in ("queued", "running"):
+    _hash_queue_gauge.labels(_state).set_function(lambda state=_state: _stats[state])
+
+# Monotonic totals are counters, so rate() works on them
+for _name, _help in (
+    ("completed", "Password hashing tasks completed"),
+    ("rejected", "Password hashing tasks rejected because the queue was full"),
+    ("rehashed", "Stored password hashes upgraded to the current bcrypt cost"),
+):
+    Counter(f"interview_ai_password_hash_{_name}_total", _help).set_function(lambda name=_name: _stats[name])
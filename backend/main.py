@@ -1,13 +1,15 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from pydantic import BaseModel
 from datetime import datetime, timedelta
 from typing import List, Optional
 import os
+import time
+import importlib
 from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
 
 # Load environment variables
 load_dotenv()
@@ -30,24 +32,129 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+from metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE, HTTP_IN_FLIGHT, HTTP_REQUESTS, HTTP_REQUEST_SECONDS,
+    render_metrics, route_template,
+)
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    if request.url.path == "/metrics":
+        return await call_next(request)
+    token = object()
+    HTTP_IN_FLIGHT.add(token)
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - start
+        HTTP_IN_FLIGHT.discard(token)
+        route = route_template(request.scope)
+        HTTP_REQUEST_SECONDS.labels(request.method, route).observe(elapsed)
+        HTTP_REQUESTS.labels(request.method, route, status_code).inc()
+
+import profiling
+from auth import is_admin_username, username_from_token
+
+@app.middleware("http")
+async def profile_requests(request: Request, call_next):
+    # Admins opt in per request with "X-Profile: 1"; PROFILE_SAMPLE_RATE adds random sampling
+    requested = False
+    if request.headers.get(profiling.PROFILE_HEADER) == "1":
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        requested = scheme.lower() == "bearer" and is_admin_username(username_from_token(token))
+    if not (requested or profiling.sampled()) or request.url.path.startswith(("/metrics", "/admin/profiles")):
+        return await call_next(request)
+    if not profiling.try_begin_profile():
+        return await call_next(request)
+
+    profile_id = profiling.profile_store.new_id()
+    profiler = profiling.SamplingProfiler().start()
+    # Lets the handler's threadpool calls and background tasks join the profile
+    context_token = profiling.set_current_profile(profile_id, profiler)
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        response.headers["X-Profile-Id"] = profile_id
+        return response
+    finally:
+        profiling.reset_current_profile(context_token)
+        profiler.stop()
+        profiling.end_profile()
+        meta = {
+            "method": request.method,
+            "path": request.url.path,
+            "status": status_code,
+            "requested": requested,
+            "created_at": datetime.utcnow().isoformat() + "Z",
+        }
+        await profiling.save_profile(profile_id, profiler, meta)
+
 # JWT Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-for-development")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing is configured in hashing.py (BCRYPT_ROUNDS)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+def env_flag(name, default="true"):
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+# Feature toggles: the analysis routers pull in the ML / cloud SDK stack, so
+# auth/CRUD-only processes can leave them out and start in well under a second.
+OPTIONAL_ROUTERS = {
+    "ai_feedback": "ENABLE_AI_FEEDBACK",
+    "speech_analysis": "ENABLE_SPEECH_ANALYSIS",
+    "video_analysis": "ENABLE_VIDEO_ANALYSIS",
+}
+# Load models at startup instead of on the first request that needs them
+WARM_UP_MODELS = env_flag("WARM_UP_MODELS", "false")
+
 # Import routers
-from routers import users, interviews, ai_feedback, speech_analysis, video_analysis
+from routers import users, interviews, profiles
+from question_bank import load_question_bank
 
 # Include routers
 app.include_router(users.router)
 app.include_router(interviews.router)
-app.include_router(ai_feedback.router)
-app.include_router(speech_analysis.router)
-app.include_router(video_analysis.router)
+app.include_router(profiles.router)
+
+optional_routers = {}
+for module_name, flag in OPTIONAL_ROUTERS.items():
+    if env_flag(flag):
+        module = importlib.import_module(f"routers.{module_name}")
+        app.include_router(module.router)
+        optional_routers[module_name] = module
+
+def warm_up_models():
+    """Eagerly load the models of every enabled analysis router."""
+    for module_name, module in optional_routers.items():
+        warm_up = getattr(module, "warm_up", None)
+        if warm_up is not None:
+            warm_up()
+            print(f"Warmed up {module_name}")
+
+@app.on_event("startup")
+async def warm_question_bank():
+    try:
+        count = await load_question_bank()
+        print(f"Question bank loaded: {count} questions")
+    except Exception as e:
+        print(f"Warning: question bank could not be loaded: {e}")
+
+@app.on_event("startup")
+async def warm_up_on_startup():
+    if WARM_UP_MODELS:
+        await run_in_threadpool(warm_up_models)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
 
 @app.get("/")
 async def root():
@@ -0,0 +1,450 @@
+"""Lightweight in-process metrics with Prometheus text exposition.
+
+Counters, gauges and histograms are plain Python objects. Recording takes
+no lock: counter increments and histogram observations are appended to a
+``deque`` (atomic under the GIL) and folded into the totals in batches or
+at scrape time, and in-flight gauges are sets of tokens. Hot paths resolve
+their label children once; ``labels()`` also caches by the raw values.
+Histograms use fixed buckets and p50/p95/p99 are estimated from them at
+scrape time, so observing never sorts.
+
+Values are per process: with several workers (see ``serve.py``) each
+worker reports only the requests it handled itself.
+"""
+import asyncio
+import functools
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+QUANTILES = (0.5, 0.95, 0.99)
+# Pending increments / observations per child before they are folded in
+FOLD_BATCH = 1024
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class _Metric:
+    metric_type = "untyped"
+
+    def __init__(self, name, documentation, labelnames=(), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        # Children keyed by the label values exactly as passed (e.g. an int
+        # status code), so repeat lookups skip the str() conversion
+        self._by_raw_values = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self._children[()] = self._new_child()
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def labels(self, *values):
+        child = self._by_raw_values.get(values)
+        if child is None:
+            key = tuple(map(str, values))
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+            self._by_raw_values[values] = child
+        return child
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+class _CounterChild:
+    __slots__ = ("value", "function", "pending", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self.function = None
+        self.pending = deque()
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1.0):
+        self.pending.append(amount)
+        if len(self.pending) >= FOLD_BATCH:
+            self.fold()
+
+    def fold(self):
+        # popleft() is atomic, so increments appended meanwhile are never lost
+        with self._lock:
+            pending = self.pending
+            total = 0.0
+            while pending:
+                try:
+                    total += pending.popleft()
+                except IndexError:
+                    break
+            self.value += total
+
+    def set_function(self, function):
+        """Read the value from ``function()`` at scrape time; it must never decrease."""
+        self.function = function
+
+    def get(self):
+        if self.function is not None:
+            return float(self.function())
+        self.fold()
+        return self.value
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1.0):
+        self._default.inc(amount)
+
+    def set_function(self, function):
+        self._default.set_function(function)
+
+    def _render_child(self, values, child):
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.get())}"]
+
+class _GaugeChild:
+    __slots__ = ("value", "function", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self.function = None
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1.0):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value):
+        self.value = float(value)
+
+    def set_function(self, function):
+        """Read the value from ``function()`` at scrape time."""
+        self.function = function
+
+    def get(self):
+        return float(self.function()) if self.function is not None else self.value
+
+class Gauge(_Metric):
+    metric_type = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount=1.0):
+        self._default.inc(amount)
+
+    def dec(self, amount=1.0):
+        self._default.dec(amount)
+
+    def set(self, value):
+        self._default.set(value)
+
+    def set_function(self, function):
+        self._default.set_function(function)
+
+    def _render_child(self, values, child):
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.get())}"]
+
+class _InFlightChild:
+    """Gauge of work in progress. Callers ``add`` a token on entry and
+    ``discard`` it on exit; both are single set operations, atomic under
+    the GIL, so no lock is taken."""
+
+    __slots__ = ("tokens",)
+
+    def __init__(self):
+        self.tokens = set()
+
+    def add(self, token):
+        self.tokens.add(token)
+
+    def discard(self, token):
+        self.tokens.discard(token)
+
+    def get(self):
+        return len(self.tokens)
+
+class InFlightGauge(_Metric):
+    metric_type = "gauge"
+
+    def _new_child(self):
+        return _InFlightChild()
+
+    def add(self, token):
+        self._default.tokens.add(token)
+
+    def discard(self, token):
+        self._default.tokens.discard(token)
+
+    def _render_child(self, values, child):
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {child.get()}"]
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "count", "pending", "_lock")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        # One slot per bucket plus the +Inf overflow bucket; not cumulative
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.pending = deque()
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        self.pending.append(value)
+        if len(self.pending) >= FOLD_BATCH:
+            self.fold()
+
+    def fold(self):
+        with self._lock:
+            pending, bounds, counts = self.pending, self.bounds, self.counts
+            total = 0.0
+            folded = 0
+            while pending:
+                try:
+                    value = pending.popleft()
+                except IndexError:
+                    break
+                counts[bisect_left(bounds, value)] += 1
+                total += value
+                folded += 1
+            self.sum += total
+            self.count += folded
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def quantile(self, q):
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        self.fold()
+        counts = list(self.counts)
+        total = sum(counts)
+        if total == 0:
+            return math.nan
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                if index == len(self.bounds):
+                    # Falls in the overflow bucket; the last finite bound is the best we know
+                    return self.bounds[-1]
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.bounds[-1]
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, registry=None):
+        self.bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value):
+        self._default.observe(value)
+
+    def time(self):
+        return self._default.time()
+
+    def _render_child(self, values, child):
+        child.fold()
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.bounds + (math.inf,), list(child.counts)):
+            cumulative += count
+            le = ("le", _format_value(bound))
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}")
+        labels = _format_labels(self.labelnames, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def render(self):
+        lines = super().render()
+        # Bucket-interpolated percentiles as a companion gauge family
+        name = f"{self.name}_quantile"
+        lines.append(f"# HELP {name} Estimated quantiles of {self.name} (from histogram buckets)")
+        lines.append(f"# TYPE {name} gauge")
+        for values, child in sorted(self._children.items()):
+            if child.count == 0:
+                continue
+            for q in QUANTILES:
+                labels = _format_labels(self.labelnames, values, ("quantile", str(q)))
+                lines.append(f"{name}{labels} {_format_value(child.quantile(q))}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            if any(existing.name == metric.name for existing in self._metrics):
+                raise ValueError(f"Duplicate metric {metric.name}")
+            self._metrics.append(metric)
+
+    def render(self):
+        lines = []
+        for metric in list(self._metrics):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def render_metrics():
+    return REGISTRY.render()
+
+# Application metrics
+HTTP_REQUESTS = Counter(
+    "interview_ai_http_requests_total", "HTTP requests handled", ["method", "route", "status"]
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "interview_ai_http_request_seconds", "HTTP request latency in seconds", ["method", "route"]
+)
+HTTP_IN_FLIGHT = InFlightGauge(
+    "interview_ai_http_requests_in_flight", "HTTP requests currently being handled"
+)
+STAGE_SECONDS = Histogram(
+    "interview_ai_stage_seconds", "Latency of individual processing stages in seconds", ["stage"]
+)
+STAGE_ERRORS = Counter(
+    "interview_ai_stage_errors_total", "Processing stages that raised", ["stage"]
+)
+STAGE_IN_FLIGHT = InFlightGauge(
+    "interview_ai_stage_in_flight", "Processing stages currently running", ["stage"]
+)
+
+# stage -> (histogram, in-flight, errors) children, resolved once per stage
+_stage_children = {}
+
+def _resolve_stage(stage):
+    children = _stage_children.get(stage)
+    if children is None:
+        children = _stage_children[stage] = (
+            STAGE_SECONDS.labels(stage), STAGE_IN_FLIGHT.labels(stage), STAGE_ERRORS.labels(stage)
+        )
+    return children
+
+class stage_timer:
+    """Time a block as ``stage`` in ``interview_ai_stage_seconds``."""
+
+    __slots__ = ("_children", "_start")
+
+    def __init__(self, stage, _children=None):
+        self._children = _children or _stage_children.get(stage) or _resolve_stage(stage)
+
+    def __enter__(self):
+        self._children[1].tokens.add(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        elapsed = time.perf_counter() - self._start
+        histogram, in_flight, errors = self._children
+        histogram.observe(elapsed)
+        in_flight.tokens.discard(self)
+        if exc_type is not None:
+            errors.inc()
+        return False
+
+def timed_stage(stage):
+    """Decorator version of :func:`stage_timer` for sync and async functions."""
+    def decorator(function):
+        children = _resolve_stage(stage)
+        if asyncio.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                with stage_timer(stage, children):
+                    return await function(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage_timer(stage, children):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def instrument_engine(engine, stage="postgres"):
+    """Record every statement run through a SQLAlchemy (sync) engine as ``stage``."""
+    from sqlalchemy import event
+
+    histogram = STAGE_SECONDS.labels(stage)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start_times"].pop()
+        histogram.observe(time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_times"):
+            conn.info["query_start_times"].pop()
+            STAGE_ERRORS.labels(stage).inc()
+
+def route_template(scope):
+    """The matched route's path template (``/interviews/{interview_id}``), so
+    label cardinality doesn't grow with ids."""
+    app = scope.get("app")
+    endpoint = scope.get("endpoint")
+    if app is None or endpoint is None:
+        return "unmatched"
+    templates = getattr(app.state, "metrics_route_templates", None)
+    if templates is None:
+        templates = {
+            getattr(route, "endpoint", None): route.path
+            for route in app.routes
+            if hasattr(route, "path")
+        }
+        app.state.metrics_route_templates = templates
+    return templates.get(endpoint, "unmatched")
@@ -0,0 +1,63 @@
+"""Apply the schema migrations in ``migrations/`` that haven't run yet.
+
+Each migration is a module named ``NNNN_description.py`` exposing
+``upgrade(connection)``. Applied migrations are recorded in the
+``schema_migrations`` table, so running this script is idempotent:
+
+    python migrate.py
+"""
+import importlib.util
+import os
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, select
+from sqlalchemy.sql import func
+
+from database import engine
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", String, primary_key=True),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+def discover_migrations():
+    names = sorted(
+        name for name in os.listdir(MIGRATIONS_DIR)
+        if name.endswith(".py") and name[:4].isdigit()
+    )
+    return [(name[:-3], os.path.join(MIGRATIONS_DIR, name)) for name in names]
+
+def load_migration(version, path):
+    spec = importlib.util.spec_from_file_location(f"migrations.{version}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def run_migrations():
+    schema_migrations.create(engine, checkfirst=True)
+    with engine.connect() as connection:
+        applied = set(connection.execute(select(schema_migrations.c.version)).scalars())
+
+    for version, path in discover_migrations():
+        if version in applied:
+            continue
+        module = load_migration(version, path)
+        # Each migration and its bookkeeping row commit together
+        with engine.begin() as connection:
+            module.upgrade(connection)
+            connection.execute(schema_migrations.insert().values(version=version))
+        print(f"Applied migration {version}")
+
+def main():
+    try:
+        run_migrations()
+        print("Migrations complete.")
+    except Exception as e:
+        print(f"Error applying migrations: {e}")
+        raise
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""Composite (user_id, created_at DESC, id) index for keyset pagination of interviews."""
+from models import Interview
+
+INDEX_NAME = "ix_interviews_user_created_id"
+
+def upgrade(connection):
+    index = next(index for index in Interview.__table__.indexes if index.name == INDEX_NAME)
+    index.create(connection, checkfirst=True)
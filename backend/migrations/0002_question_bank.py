@@ -0,0 +1,5 @@
+"""Reusable question catalog tagged by interview type and difficulty."""
+from models import QuestionBankItem
+
+def upgrade(connection):
+    QuestionBankItem.__table__.create(connection, checkfirst=True)
@@ -0,0 +1,5 @@
+"""Per-user progress aggregates for the Dashboard (see progress.py)."""
+from models import UserProgress
+
+def upgrade(connection):
+    UserProgress.__table__.create(connection, checkfirst=True)
@@ -1,7 +1,8 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Text, Float
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Text, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
+from datetime import datetime, timezone
 import uuid
 
 class User(Base):
@@ -24,12 +25,19 @@ class Interview(Base):
     user_id = Column(String, ForeignKey("users.id"))
     interview_type = Column(String)  # technical, behavioral, etc.
     status = Column(String)  # scheduled, completed, cancelled
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Stamped in Python as well so every row carries microseconds: SQLite's
+    # CURRENT_TIMESTAMP has second precision and would break keyset cursors
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     user = relationship("User", back_populates="interviews")
-    questions = relationship("InterviewQuestion", back_populates="interview")
-    feedbacks = relationship("InterviewFeedback", back_populates="interview")
+    questions = relationship("InterviewQuestion", back_populates="interview", order_by="InterviewQuestion.question_order")
+    feedbacks = relationship("InterviewFeedback", back_populates="interview", order_by="InterviewFeedback.created_at")
+
+    # Backs keyset pagination of a user's history (newest first, id as tie-breaker)
+    __table_args__ = (
+        Index("ix_interviews_user_created_id", "user_id", created_at.desc(), "id"),
+    )
 
 class InterviewQuestion(Base):
     __tablename__ = "interview_questions"
@@ -41,7 +49,7 @@ class InterviewQuestion(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     interview = relationship("Interview", back_populates="questions")
-    answers = relationship("InterviewAnswer", back_populates="question")
+    answers = relationship("InterviewAnswer", back_populates="question", order_by="InterviewAnswer.created_at")
 
 class InterviewAnswer(Base):
     __tablename__ = "interview_answers"
@@ -64,6 +72,38 @@ class InterviewFeedback(Base):
     confidence_score = Column(Float, nullable=True)
     technical_score = Column(Float, nullable=True)
     communication_score = Column(Float, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Python-side stamp for microsecond order: rebuild_progress.py replays by it
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now())
 
     interview = relationship("Interview", back_populates="feedbacks")
+
+class QuestionBankItem(Base):
+    __tablename__ = "question_bank"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    interview_type = Column(String, nullable=False)  # technical, behavioral, hr
+    difficulty = Column(String, nullable=False, default="medium")  # easy, medium, hard
+    question_text = Column(Text, nullable=False)
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_question_bank_type_difficulty", "interview_type", "difficulty"),
+    )
+
+class UserProgress(Base):
+    """Running per-user score aggregates, one row per (interview type, metric).
+
+    Maintained incrementally by progress.record_scores; rebuild_progress.py
+    recomputes it from interview_feedbacks."""
+    __tablename__ = "user_progress"
+
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    interview_type = Column(String, primary_key=True)
+    metric = Column(String, primary_key=True)  # technical, communication, confidence
+    count = Column(Integer, nullable=False, default=0)
+    mean = Column(Float, nullable=False, default=0.0)
+    ewma = Column(Float, nullable=True)
+    best = Column(Float, nullable=True)
+    last = Column(Float, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
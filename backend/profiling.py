@@ -0,0 +1,278 @@
+"""Opt-in per-request sampling profiler with an on-disk ring buffer.
+
+A profiled request gets a background thread that samples the stacks of the
+threads doing its work (``sys._current_frames``) every few milliseconds.
+The samples are written as collapsed stacks (for flamegraph.pl / inferno) and
+as a speedscope JSON file under ``PROFILE_DIR``. Only the newest
+``PROFILE_MAX_PROFILES`` profiles are kept.
+
+Async handlers run on the event loop thread. While a profiled request awaits
+I/O, the samples also show whatever else the loop is doing, or the loop
+idling in ``select``. CPU-heavy stages (video analysis, speech recognition)
+run on worker threads through :func:`run_in_threadpool`. While the request
+is profiled, that helper adds the worker thread to the sampled set, and its
+stacks appear under a ``<worker thread>`` root. Work handed to
+``BackgroundTasks`` (LLM feedback) runs after the response is sent. Wrap it
+with :func:`background` and it is recorded as its own profile, whose
+``parent`` is the request's profile id.
+"""
+import contextvars
+import functools
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool as _run_in_threadpool
+
+load_dotenv()
+
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(tempfile.gettempdir(), "interview-ai-profiles"))
+PROFILE_MAX_PROFILES = int(os.getenv("PROFILE_MAX_PROFILES", "50"))
+PROFILE_INTERVAL_SECONDS = float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000
+# Fraction of all requests profiled without being asked to (0 disables sampling)
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_HEADER = "x-profile"
+
+_PROFILE_ID = re.compile(r"^[0-9A-Za-z_-]+$")
+PROFILE_FILES = {
+    "collapsed": "stacks.collapsed.txt",
+    "speedscope": "profile.speedscope.json",
+}
+
+WORKER_THREAD_ROOT = ("<worker thread>", "", 0)
+
+def _frame_key(frame):
+    code = frame.f_code
+    return (code.co_name, code.co_filename, code.co_firstlineno)
+
+class SamplingProfiler:
+    def __init__(self, thread_id=None, interval=PROFILE_INTERVAL_SECONDS):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        # Extra threads working for the profiled request (see run_in_threadpool)
+        self.worker_thread_ids = set()
+        self.interval = interval
+        self.samples = Counter()
+        self.started_at = None
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            self._sample(frames.get(self.thread_id))
+            for thread_id in list(self.worker_thread_ids):
+                self._sample(frames.get(thread_id), root=WORKER_THREAD_ROOT)
+
+    def _sample(self, frame, root=None):
+        stack = []
+        while frame is not None:
+            stack.append(_frame_key(frame))
+            frame = frame.f_back
+        if stack:
+            if root is not None:
+                stack.append(root)
+            # Root first, as flame graphs expect
+            self.samples[tuple(reversed(stack))] += 1
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self.started_at
+        return self
+
+    def collapsed(self):
+        lines = []
+        for stack, count in self.samples.most_common():
+            names = ";".join(f"{name} ({os.path.basename(filename)}:{line})" for name, filename, line in stack)
+            lines.append(f"{names} {count}")
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name):
+        frames = []
+        frame_index = {}
+        samples = []
+        weights = []
+        for stack, count in self.samples.items():
+            indices = []
+            for key in stack:
+                if key not in frame_index:
+                    frame_index[key] = len(frames)
+                    frames.append({"name": key[0], "file": key[1], "line": key[2]})
+                indices.append(frame_index[key])
+            samples.append(indices)
+            weights.append(count * self.interval)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "interview-ai",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+class ProfileStore:
+    """Keeps the newest ``max_profiles`` profiles, one directory each."""
+
+    def __init__(self, directory=PROFILE_DIR, max_profiles=PROFILE_MAX_PROFILES):
+        self.directory = directory
+        self.max_profiles = max_profiles
+        self._lock = threading.Lock()
+
+    def new_id(self):
+        return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f") + "-" + uuid.uuid4().hex[:8]
+
+    def save(self, profile_id, profiler, meta):
+        name = f"{meta.get('method', '')} {meta.get('path', '')}".strip()
+        target = os.path.join(self.directory, profile_id)
+        os.makedirs(target, exist_ok=True)
+        with open(os.path.join(target, PROFILE_FILES["collapsed"]), "w") as f:
+            f.write(profiler.collapsed())
+        with open(os.path.join(target, PROFILE_FILES["speedscope"]), "w") as f:
+            json.dump(profiler.speedscope(name), f)
+        meta = {
+            **meta,
+            "id": profile_id,
+            "duration_seconds": round(profiler.duration, 6),
+            "samples": sum(profiler.samples.values()),
+            "interval_seconds": profiler.interval,
+        }
+        with open(os.path.join(target, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        self._prune()
+        return meta
+
+    def _profile_ids(self):
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        # Ids start with a UTC timestamp, so name order is age order
+        return sorted(name for name in names if _PROFILE_ID.match(name))
+
+    def _prune(self):
+        with self._lock:
+            profile_ids = self._profile_ids()
+            for profile_id in profile_ids[:max(len(profile_ids) - self.max_profiles, 0)]:
+                shutil.rmtree(os.path.join(self.directory, profile_id), ignore_errors=True)
+
+    def list(self):
+        profiles = []
+        for profile_id in reversed(self._profile_ids()):
+            try:
+                with open(os.path.join(self.directory, profile_id, "meta.json")) as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return profiles
+
+    def path(self, profile_id, kind):
+        """Path to a stored profile file, or None if it doesn't exist."""
+        if not _PROFILE_ID.match(profile_id) or kind not in PROFILE_FILES:
+            return None
+        path = os.path.join(self.directory, profile_id, PROFILE_FILES[kind])
+        return path if os.path.isfile(path) else None
+
+profile_store = ProfileStore()
+
+# One profile at a time per process keeps the overhead bounded
+_active = threading.Semaphore(1)
+
+def try_begin_profile():
+    return _active.acquire(blocking=False)
+
+def end_profile():
+    _active.release()
+
+def sampled():
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+# (profile id, profiler) of the request being handled, if it is profiled
+_current_profile = contextvars.ContextVar("current_profile", default=None)
+
+def set_current_profile(profile_id, profiler):
+    return _current_profile.set((profile_id, profiler))
+
+def reset_current_profile(token):
+    _current_profile.reset(token)
+
+async def save_profile(profile_id, profiler, meta):
+    try:
+        await _run_in_threadpool(profile_store.save, profile_id, profiler, meta)
+    except OSError as e:
+        print(f"Warning: could not store profile {profile_id}: {e}")
+
+async def run_in_threadpool(func, *args, **kwargs):
+    """``fastapi.concurrency.run_in_threadpool`` that, inside a profiled
+    request, also samples the worker thread while ``func`` runs."""
+    current = _current_profile.get()
+    if current is None:
+        return await _run_in_threadpool(func, *args, **kwargs)
+    profiler = current[1]
+
+    def sampled_call():
+        thread_id = threading.get_ident()
+        profiler.worker_thread_ids.add(thread_id)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.worker_thread_ids.discard(thread_id)
+
+    return await _run_in_threadpool(sampled_call)
+
+def background(func):
+    """Wrap an async function before handing it to ``BackgroundTasks``: if
+    the current request is profiled, the task gets a profile of its own."""
+    current = _current_profile.get()
+    if current is None:
+        return func
+    parent_id = current[0]
+
+    @functools.wraps(func)
+    async def profiled_task(*args, **kwargs):
+        if not try_begin_profile():
+            return await func(*args, **kwargs)
+        profile_id = profile_store.new_id()
+        profiler = SamplingProfiler().start()
+        token = set_current_profile(profile_id, profiler)
+        failed = True
+        try:
+            result = await func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            reset_current_profile(token)
+            profiler.stop()
+            end_profile()
+            await save_profile(profile_id, profiler, {
+                "method": "BACKGROUND",
+                "path": func.__qualname__,
+                "status": "error" if failed else "ok",
+                "requested": False,
+                "parent": parent_id,
+                "created_at": datetime.utcnow().isoformat() + "Z",
+            })
+    return profiled_task
@@ -0,0 +1,68 @@
+"""Incrementally maintained per-user score aggregates.
+
+Every time feedback scores are written, the matching ``user_progress`` rows
+(one per interview type and metric) are updated in the same transaction:
+count, running mean, EWMA, best and last score. Reading a user's progress
+is then a single primary-key range lookup, however long their history is.
+"""
+import os
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import UserProgress
+
+# Weight of the newest score in the exponentially weighted moving average
+PROGRESS_EWMA_ALPHA = float(os.getenv("PROGRESS_EWMA_ALPHA", "0.3"))
+SCORE_METRICS = ("technical", "communication", "confidence")
+
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+def apply_score(row, score, alpha=PROGRESS_EWMA_ALPHA):
+    """Fold one score into a progress row (or any object with the same fields)."""
+    row.count = (row.count or 0) + 1
+    row.mean = (row.mean or 0.0) + (score - (row.mean or 0.0)) / row.count
+    row.ewma = score if row.ewma is None else alpha * score + (1 - alpha) * row.ewma
+    row.best = score if row.best is None else max(row.best, score)
+    row.last = score
+
+def _numeric_scores(scores):
+    numeric = {}
+    for metric in SCORE_METRICS:
+        try:
+            numeric[metric] = float(scores[metric])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return numeric
+
+async def record_scores(db: AsyncSession, user_id: str, interview_type: str, scores: dict):
+    """Update the user's aggregates with one feedback's scores. Does not
+    commit: the caller commits together with the feedback row."""
+    scores = _numeric_scores(scores)
+    if not scores:
+        return
+
+    # Make sure the rows exist without racing a concurrent first insert, then
+    # lock them so concurrent feedback for the same user is applied serially
+    insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        await db.execute(insert(UserProgress).values([
+            {"user_id": user_id, "interview_type": interview_type, "metric": metric, "count": 0, "mean": 0.0}
+            for metric in scores
+        ]).on_conflict_do_nothing())
+
+    result = await db.execute(select(UserProgress).where(
+        UserProgress.user_id == user_id,
+        UserProgress.interview_type == interview_type,
+        UserProgress.metric.in_(list(scores))
+    ).with_for_update())
+    rows = {row.metric: row for row in result.scalars()}
+
+    for metric, score in scores.items():
+        row = rows.get(metric)
+        if row is None:
+            row = UserProgress(user_id=user_id, interview_type=interview_type, metric=metric, count=0, mean=0.0)
+            db.add(row)
+        apply_score(row, score)
@@ -0,0 +1,118 @@
+"""In-memory index over the ``question_bank`` table.
+
+The catalog is small and read-mostly, so it is loaded once at startup and
+kept in memory keyed by ``(interview_type, difficulty)``. Each user gets a
+lazily shuffled "deck" per bucket so consecutive interviews don't repeat
+questions until the bucket has been exhausted.
+
+The no-repeat guarantee is per process and best effort: decks live in
+this worker's memory only. Under the multi-worker launcher (serve.py)
+each worker keeps its own decks, and they are lost on every max-requests
+recycle, restart or reload. A user can therefore be given a question
+again before the bucket is exhausted. This also happens when their deck
+is evicted from the LRU.
+"""
+import os
+import random
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from database import AsyncSessionLocal
+from models import QuestionBankItem
+
+# Upper bound on per-user sampling state kept in memory (least recently used is dropped)
+QUESTION_BANK_MAX_USERS = int(os.getenv("QUESTION_BANK_MAX_USERS", "10000"))
+
+class _Deck:
+    """Sparse Fisher-Yates shuffle: each draw is O(1) and only swapped
+    positions are stored, so a fresh deck costs nothing to create."""
+
+    __slots__ = ("size", "remaining", "swaps")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.remaining = size
+        self.swaps: Dict[int, int] = {}
+
+    def draw(self, rng: random.Random) -> int:
+        if self.remaining == 0:
+            # Every question has been seen once; start a new cycle
+            self.remaining = self.size
+            self.swaps.clear()
+        j = rng.randrange(self.remaining)
+        last = self.remaining - 1
+        picked = self.swaps.get(j, j)
+        self.swaps[j] = self.swaps.pop(last, last)
+        if j == last:
+            self.swaps.pop(j, None)
+        self.remaining = last
+        return picked
+
+class QuestionBankIndex:
+    def __init__(self, max_users: int = QUESTION_BANK_MAX_USERS, seed: Optional[int] = None):
+        self._buckets: Dict[Tuple[str, Optional[str]], List[Tuple[str, str]]] = {}
+        self._decks: "OrderedDict[Tuple[str, str, Optional[str]], _Deck]" = OrderedDict()
+        self._max_users = max_users
+        self._rng = random.Random(seed)
+
+    def load(self, items):
+        """Rebuild the index from ``(id, interview_type, difficulty, question_text)`` rows."""
+        buckets: Dict[Tuple[str, Optional[str]], List[Tuple[str, str]]] = {}
+        for item_id, interview_type, difficulty, question_text in items:
+            entry = (item_id, question_text)
+            buckets.setdefault((interview_type, difficulty), []).append(entry)
+            # ``None`` difficulty means "any difficulty"
+            buckets.setdefault((interview_type, None), []).append(entry)
+        self._buckets = buckets
+        # Deck positions refer to the old bucket layout
+        self._decks.clear()
+
+    def __len__(self):
+        return sum(len(entries) for (_, difficulty), entries in self._buckets.items() if difficulty is None)
+
+    def available(self, interview_type: str, difficulty: Optional[str] = None) -> int:
+        return len(self._buckets.get((interview_type, difficulty), ()))
+
+    def sample(self, user_id: str, interview_type: str, difficulty: Optional[str], k: int) -> List[Tuple[str, str]]:
+        """Draw up to ``k`` distinct questions, avoiding ones this user was
+        already given by this process until the bucket runs out."""
+        entries = self._buckets.get((interview_type, difficulty))
+        if not entries:
+            return []
+        k = min(k, len(entries))
+
+        key = (user_id, interview_type, difficulty)
+        deck = self._decks.get(key)
+        if deck is None or deck.size != len(entries):
+            deck = _Deck(len(entries))
+            self._decks[key] = deck
+            if len(self._decks) > self._max_users:
+                self._decks.popitem(last=False)
+        else:
+            self._decks.move_to_end(key)
+
+        picked: List[int] = []
+        seen = set()
+        while len(picked) < k:
+            position = deck.draw(self._rng)
+            # Only possible right after a new cycle starts mid-draw
+            if position in seen:
+                continue
+            seen.add(position)
+            picked.append(position)
+        return [entries[position] for position in picked]
+
+question_bank = QuestionBankIndex()
+
+async def load_question_bank():
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(
+            QuestionBankItem.id,
+            QuestionBankItem.interview_type,
+            QuestionBankItem.difficulty,
+            QuestionBankItem.question_text,
+        ).where(QuestionBankItem.is_active.is_(True)))
+        question_bank.load(result.all())
+    return len(question_bank)
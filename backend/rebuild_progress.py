@@ -0,0 +1,107 @@
+"""Rebuild the ``user_progress`` aggregates from ``interview_feedbacks``.
+
+Use after a backfill, a change to ``PROGRESS_EWMA_ALPHA`` or any drift:
+
+    python rebuild_progress.py                 # every user
+    python rebuild_progress.py --user <id>     # a single user
+
+Each scored feedback row is replayed once, in creation order, so count,
+mean and best always match the live path. EWMA and "last" also match,
+unless two generations for the same user overlapped and finished in the
+opposite order to the one they were started in.
+
+It is safe to run while the API is serving. The rebuild locks
+``user_progress`` against writers before it reads any feedback: EXCLUSIVE
+table lock on PostgreSQL; on SQLite the DELETE takes the database write
+lock. ``progress.record_scores`` writes in the same transaction as the
+scores it records, so each feedback is either in the replay or applied
+after the rebuild commits, never lost or counted twice.
+"""
+import argparse
+
+from sqlalchemy import delete, insert, select, text
+
+from database import SessionLocal
+from models import Interview, InterviewFeedback, UserProgress
+from progress import SCORE_METRICS, apply_score
+
+class _Aggregate:
+    __slots__ = ("count", "mean", "ewma", "best", "last")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.ewma = None
+        self.best = None
+        self.last = None
+
+def rebuild(db, user_id=None):
+    # Block record_scores for the rest of this transaction, before reading
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("LOCK TABLE user_progress IN EXCLUSIVE MODE"))
+    clear = delete(UserProgress)
+    if user_id:
+        clear = clear.where(UserProgress.user_id == user_id)
+    db.execute(clear)
+
+    query = select(
+        Interview.user_id,
+        Interview.interview_type,
+        InterviewFeedback.technical_score,
+        InterviewFeedback.communication_score,
+        InterviewFeedback.confidence_score,
+    ).join(Interview, InterviewFeedback.interview_id == Interview.id).order_by(
+        InterviewFeedback.created_at, InterviewFeedback.id
+    )
+    if user_id:
+        query = query.where(Interview.user_id == user_id)
+
+    aggregates = {}
+    for row in db.execute(query.execution_options(yield_per=1000)):
+        scores = dict(zip(SCORE_METRICS, (row.technical_score, row.communication_score, row.confidence_score)))
+        for metric, score in scores.items():
+            if score is None:
+                continue
+            key = (row.user_id, row.interview_type, metric)
+            aggregate = aggregates.get(key)
+            if aggregate is None:
+                aggregate = aggregates[key] = _Aggregate()
+            apply_score(aggregate, float(score))
+
+    # Deleted and re-inserted in one transaction, so readers never see a half-built table
+    rows = [
+        {
+            "user_id": key[0],
+            "interview_type": key[1],
+            "metric": key[2],
+            "count": aggregate.count,
+            "mean": aggregate.mean,
+            "ewma": aggregate.ewma,
+            "best": aggregate.best,
+            "last": aggregate.last,
+        }
+        for key, aggregate in aggregates.items()
+    ]
+    if rows:
+        db.execute(insert(UserProgress), rows)
+    db.commit()
+    return len(rows)
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild user_progress from interview feedback")
+    parser.add_argument("--user", help="only rebuild this user id")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        count = rebuild(db, args.user)
+        print(f"Rebuilt {count} progress rows.")
+    except Exception as e:
+        db.rollback()
+        print(f"Error rebuilding progress: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 import uuid
 import os
 import openai
 
-from database import get_db
+from database import get_async_db, AsyncSessionLocal
 from models import User, Interview, InterviewFeedback, InterviewQuestion, InterviewAnswer
 from schemas import Feedback, FeedbackCreate
 from auth import get_current_active_user
+from admission import admission
+from metrics import timed_stage
+import profiling
+from progress import record_scores
 
 router = APIRouter(
     prefix="/ai-feedback",
@@ -23,35 +28,29 @@ openai.api_key = os.getenv("OPENAI_API_KEY")
 async def generate_ai_feedback(
     interview_id: str,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user),
+    admission_slot: None = Depends(admission("feedback"))
 ):
     # Verify that the interview belongs to the current user
-    interview = db.query(Interview).filter(
+    result = await db.execute(select(Interview).where(
         Interview.id == interview_id,
         Interview.user_id == current_user.id
-    ).first()
+    ))
+    interview = result.scalars().first()
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
     # Get all questions and answers for this interview
-    questions = db.query(InterviewQuestion).filter(
+    result = await db.execute(select(InterviewQuestion).where(
         InterviewQuestion.interview_id == interview_id
-    ).order_by(InterviewQuestion.question_order).all()
+    ).order_by(InterviewQuestion.question_order))
+    questions = result.scalars().all()
     
     if not questions:
         raise HTTPException(status_code=404, detail="No questions found for this interview")
     
-    # Process in background to not block the response
-    background_tasks.add_task(
-        process_interview_feedback,
-        db,
-        interview_id,
-        questions,
-        current_user.id
-    )
-    
     # Create a pending feedback entry
     db_feedback = InterviewFeedback(
         id=str(uuid.uuid4()),
@@ -59,59 +58,75 @@ async def generate_ai_feedback(
         feedback_text="Feedback generation in progress...",
     )
     db.add(db_feedback)
-    db.commit()
-    db.refresh(db_feedback)
+    await db.commit()
+    await db.refresh(db_feedback)
+    
+    # Process in background to not block the response. The task opens its own
+    # session because the request-scoped one is closed once the response is sent.
+    background_tasks.add_task(
+        profiling.background(process_interview_feedback),
+        db_feedback.id,
+        interview,
+        questions,
+        current_user.id
+    )
     
     return db_feedback
 
-async def process_interview_feedback(db: Session, interview_id: str, questions, user_id: str):
-    try:
-        # Prepare context for OpenAI
-        interview_context = []
-        
-        for question in questions:
-            # Get the answer for this question
-            answer = db.query(InterviewAnswer).filter(
-                InterviewAnswer.question_id == question.id
-            ).first()
+async def process_interview_feedback(feedback_id: str, interview, questions, user_id: str):
+    # Every /generate call creates its own pending row; only that row is filled
+    # in, so each scored feedback is counted in the progress aggregates once
+    async with AsyncSessionLocal() as db:
+        try:
+            # Prepare context for OpenAI, fetching every answer in one query
+            result = await db.execute(select(InterviewAnswer).where(
+                InterviewAnswer.question_id.in_([question.id for question in questions])
+            ).order_by(InterviewAnswer.created_at))
+            answers_by_question = {}
+            for answer in result.scalars():
+                answers_by_question.setdefault(answer.question_id, answer)
             
-            if answer:
-                interview_context.append({
-                    "question": question.question_text,
-                    "answer": answer.answer_text
-                })
-        
-        if not interview_context:
-            update_feedback_error(db, interview_id, "No answers found for interview questions")
-            return
-        
-        # Generate AI feedback using OpenAI
-        feedback_text, scores = await generate_openai_feedback(interview_context)
-        
-        # Update the feedback in the database
-        db_feedback = db.query(InterviewFeedback).filter(
-            InterviewFeedback.interview_id == interview_id
-        ).first()
+            interview_context = []
+            for question in questions:
+                answer = answers_by_question.get(question.id)
+                if answer:
+                    interview_context.append({
+                        "question": question.question_text,
+                        "answer": answer.answer_text
+                    })
+            
+            if not interview_context:
+                await update_feedback_error(db, feedback_id, "No answers found for interview questions")
+                return
+            
+            # Generate AI feedback using OpenAI
+            feedback_text, scores = await generate_openai_feedback(interview_context)
+            
+            # Update the feedback in the database
+            db_feedback = await db.get(InterviewFeedback, feedback_id)
+            
+            if db_feedback:
+                db_feedback.feedback_text = feedback_text
+                db_feedback.technical_score = scores.get("technical", None)
+                db_feedback.communication_score = scores.get("communication", None)
+                db_feedback.confidence_score = scores.get("confidence", None)
+
+                # Keep the Dashboard aggregates in step, in the same transaction
+                await record_scores(db, user_id, interview.interview_type, scores)
+                await db.commit()
         
-        if db_feedback:
-            db_feedback.feedback_text = feedback_text
-            db_feedback.technical_score = scores.get("technical", None)
-            db_feedback.communication_score = scores.get("communication", None)
-            db_feedback.confidence_score = scores.get("confidence", None)
-            db.commit()
-    
-    except Exception as e:
-        update_feedback_error(db, interview_id, str(e))
+        except Exception as e:
+            await db.rollback()
+            await update_feedback_error(db, feedback_id, str(e))
 
-def update_feedback_error(db: Session, interview_id: str, error_message: str):
-    db_feedback = db.query(InterviewFeedback).filter(
-        InterviewFeedback.interview_id == interview_id
-    ).first()
+async def update_feedback_error(db: AsyncSession, feedback_id: str, error_message: str):
+    db_feedback = await db.get(InterviewFeedback, feedback_id)
     
     if db_feedback:
         db_feedback.feedback_text = f"Error generating feedback: {error_message}"
-        db.commit()
+        await db.commit()
 
+@timed_stage("llm")
 async def generate_openai_feedback(interview_context):
     # Prepare the prompt for GPT-4
     prompt = "You are an expert interview coach providing feedback on a technical interview. "
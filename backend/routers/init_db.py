@@ -3,8 +3,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from models import Base
 from database import engine, get_db
-from passlib.context import CryptContext
-from models import User
+from models import User, QuestionBankItem
+from hashing import pwd_context
 import uuid
 
 # Create tables
@@ -14,9 +14,6 @@ Base.metadata.create_all(bind=engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 db = SessionLocal()
 
-# Password context for hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 def create_admin_user():
     # Check if admin user already exists
     admin_user = db.query(User).filter(User.username == "admin").first()
@@ -40,9 +37,54 @@ def create_admin_user():
     db.commit()
     print("Admin user created successfully.")
 
+# Starter catalog for the question bank: (interview_type, difficulty, question_text)
+DEFAULT_QUESTIONS = [
+    ("technical", "easy", "What is the difference between a list and a tuple in Python?"),
+    ("technical", "easy", "Explain what an HTTP status code is and give three common examples."),
+    ("technical", "easy", "What is the difference between a process and a thread?"),
+    ("technical", "medium", "How does a hash map handle collisions?"),
+    ("technical", "medium", "Explain database indexing and when an index can hurt performance."),
+    ("technical", "medium", "Describe how you would design a REST API for a to-do application."),
+    ("technical", "medium", "What is the difference between SQL and NoSQL databases, and when would you choose each?"),
+    ("technical", "hard", "Design a URL shortening service that handles millions of requests per day."),
+    ("technical", "hard", "How would you find and fix a memory leak in a long-running service?"),
+    ("technical", "hard", "Explain how you would make a distributed cache consistent with its database."),
+    ("behavioral", "easy", "Tell me about yourself."),
+    ("behavioral", "easy", "Describe a project you are proud of."),
+    ("behavioral", "medium", "Tell me about a time you disagreed with a teammate and how you resolved it."),
+    ("behavioral", "medium", "Describe a situation where you had to meet a tight deadline."),
+    ("behavioral", "medium", "Tell me about a time you made a mistake at work. What did you learn?"),
+    ("behavioral", "hard", "Describe a time you had to lead a team through a significant change."),
+    ("behavioral", "hard", "Tell me about a decision you made with incomplete information."),
+    ("hr", "easy", "Why are you interested in this role?"),
+    ("hr", "easy", "What are your greatest strengths?"),
+    ("hr", "medium", "Where do you see yourself in five years?"),
+    ("hr", "medium", "What is your biggest weakness and how are you working on it?"),
+    ("hr", "medium", "Why are you leaving your current position?"),
+    ("hr", "hard", "What are your salary expectations, and how did you arrive at them?"),
+]
+
+def seed_question_bank():
+    if db.query(QuestionBankItem).first():
+        print("Question bank already seeded.")
+        return
+
+    db.add_all([
+        QuestionBankItem(
+            id=str(uuid.uuid4()),
+            interview_type=interview_type,
+            difficulty=difficulty,
+            question_text=question_text
+        )
+        for interview_type, difficulty, question_text in DEFAULT_QUESTIONS
+    ])
+    db.commit()
+    print(f"Question bank seeded with {len(DEFAULT_QUESTIONS)} questions.")
+
 def main():
     try:
         create_admin_user()
+        seed_question_bank()
         print("Database initialized successfully.")
     except Exception as e:
         print(f"Error initializing database: {e}")
@@ -1,11 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from datetime import datetime, timezone
+from typing import Optional
+import base64
+import binascii
+import hashlib
+import json
 import uuid
 
-from database import get_db
-from models import User, Interview, InterviewQuestion
-from schemas import Interview as InterviewSchema, InterviewCreate, Question, QuestionCreate
+from database import get_async_db
+from models import User, Interview, InterviewQuestion, InterviewAnswer
+from question_bank import question_bank
+from schemas import (
+    Interview as InterviewSchema, InterviewCreate, InterviewStart, InterviewDetail, InterviewPage,
+    Question, QuestionCreate, QuestionBulkCreate, AnswerBulkCreate, BulkCreateResponse,
+)
 from auth import get_current_active_user
 
 router = APIRouter(
@@ -14,10 +25,29 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+def encode_cursor(interview: Interview) -> str:
+    payload = json.dumps([interview.created_at.isoformat(), interview.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, interview_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(interview_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def get_owned_interview(db: AsyncSession, interview_id: str, user_id: str):
+    result = await db.execute(select(Interview).where(
+        Interview.id == interview_id,
+        Interview.user_id == user_id
+    ))
+    return result.scalars().first()
+
 @router.post("/", response_model=InterviewSchema)
-def create_interview(
+async def create_interview(
     interview: InterviewCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     db_interview = Interview(
@@ -27,51 +57,138 @@ def create_interview(
         status=interview.status
     )
     db.add(db_interview)
-    db.commit()
-    db.refresh(db_interview)
+    await db.commit()
+    await db.refresh(db_interview)
     return db_interview
 
-@router.get("/", response_model=List[InterviewSchema])
-def read_interviews(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+@router.post("/start", response_model=InterviewDetail)
+async def start_interview(
+    interview: InterviewStart,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    interviews = db.query(Interview).filter(
-        Interview.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    return interviews
+    # Questions come from the in-memory bank, so no client payload is needed
+    sampled = question_bank.sample(
+        current_user.id, interview.interview_type, interview.difficulty, interview.num_questions
+    )
+    if not sampled:
+        raise HTTPException(status_code=404, detail="No questions available for this interview type")
+
+    # Timestamps are set here so the response needs no refresh round trip
+    now = datetime.now(timezone.utc)
+    db_interview = Interview(
+        id=str(uuid.uuid4()),
+        user_id=current_user.id,
+        interview_type=interview.interview_type,
+        status="scheduled",
+        created_at=now
+    )
+    db.add(db_interview)
+    await db.flush()
+
+    questions = [
+        {
+            "id": str(uuid.uuid4()),
+            "interview_id": db_interview.id,
+            "question_text": question_text,
+            "question_order": order,
+            "created_at": now,
+        }
+        for order, (_, question_text) in enumerate(sampled, start=1)
+    ]
+    await db.execute(insert(InterviewQuestion), questions)
+    await db.commit()
+
+    return {
+        "id": db_interview.id,
+        "user_id": db_interview.user_id,
+        "interview_type": db_interview.interview_type,
+        "status": db_interview.status,
+        "created_at": now,
+        "questions": questions,
+        "feedbacks": [],
+    }
+
+@router.get("/", response_model=InterviewPage)
+async def read_interviews(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    # Keyset pagination over (created_at DESC, id) so every page is a single
+    # range scan on ix_interviews_user_created_id, however deep it is.
+    query = select(Interview).where(Interview.user_id == current_user.id)
+    if cursor:
+        created_at, interview_id = decode_cursor(cursor)
+        query = query.where(
+            # Redundant with the OR below, but it is what gives the planner an
+            # index range condition instead of filtering every newer row
+            Interview.created_at <= created_at,
+            or_(
+                Interview.created_at < created_at,
+                and_(Interview.created_at == created_at, Interview.id > interview_id)
+            )
+        )
+    query = query.order_by(Interview.created_at.desc(), Interview.id).limit(limit + 1)
+
+    result = await db.execute(query)
+    interviews = result.scalars().all()
+    next_cursor = None
+    if len(interviews) > limit:
+        interviews = interviews[:limit]
+        next_cursor = encode_cursor(interviews[-1])
+    return {"items": interviews, "next_cursor": next_cursor}
 
 @router.get("/{interview_id}", response_model=InterviewSchema)
-def read_interview(
+async def read_interview(
     interview_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_interview = db.query(Interview).filter(
+    db_interview = await get_owned_interview(db, interview_id, current_user.id)
+    if db_interview is None:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    return db_interview
+
+@router.get("/{interview_id}/full", response_model=InterviewDetail)
+async def read_interview_full(
+    interview_id: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    # Load the whole tree up front: one query per level instead of one per row
+    result = await db.execute(select(Interview).where(
         Interview.id == interview_id,
         Interview.user_id == current_user.id
-    ).first()
+    ).options(
+        selectinload(Interview.questions).selectinload(InterviewQuestion.answers),
+        selectinload(Interview.feedbacks),
+    ))
+    db_interview = result.scalars().first()
     if db_interview is None:
         raise HTTPException(status_code=404, detail="Interview not found")
-    return db_interview
+
+    body = InterviewDetail.model_validate(db_interview, from_attributes=True).model_dump_json()
+    etag = '"' + hashlib.sha256(body.encode()).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @router.post("/questions/", response_model=Question)
-def create_question(
+async def create_question(
     question: QuestionCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     # Verify that the interview belongs to the current user
-    interview = db.query(Interview).filter(
-        Interview.id == question.interview_id,
-        Interview.user_id == current_user.id
-    ).first()
-    
+    interview = await get_owned_interview(db, question.interview_id, current_user.id)
+
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
-    
+
     db_question = InterviewQuestion(
         id=str(uuid.uuid4()),
         interview_id=question.interview_id,
@@ -79,6 +196,68 @@ def create_question(
         question_order=question.question_order
     )
     db.add(db_question)
-    db.commit()
-    db.refresh(db_question)
+    await db.commit()
+    await db.refresh(db_question)
     return db_question
+
+@router.post("/questions/bulk", response_model=BulkCreateResponse)
+async def create_questions_bulk(
+    payload: QuestionBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    # One ownership check for the whole batch
+    interview = await get_owned_interview(db, payload.interview_id, current_user.id)
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "interview_id": payload.interview_id,
+            "question_text": question.question_text,
+            "question_order": question.question_order,
+        }
+        for question in payload.questions
+    ]
+    # Single executemany INSERT, committed in one transaction
+    await db.execute(insert(InterviewQuestion), rows)
+    await db.commit()
+    return {"ids": [row["id"] for row in rows]}
+
+@router.post("/answers/bulk", response_model=BulkCreateResponse)
+async def create_answers_bulk(
+    payload: AnswerBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    interview = await get_owned_interview(db, payload.interview_id, current_user.id)
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+
+    # Every answer must target a question of this interview
+    question_ids = {answer.question_id for answer in payload.answers}
+    result = await db.execute(select(InterviewQuestion.id).where(
+        InterviewQuestion.interview_id == payload.interview_id,
+        InterviewQuestion.id.in_(question_ids)
+    ))
+    unknown = question_ids - set(result.scalars().all())
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Questions not found in this interview: {', '.join(sorted(unknown))}"
+        )
+
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "question_id": answer.question_id,
+            "answer_text": answer.answer_text,
+            "audio_url": answer.audio_url,
+            "video_url": answer.video_url,
+        }
+        for answer in payload.answers
+    ]
+    await db.execute(insert(InterviewAnswer), rows)
+    await db.commit()
+    return {"ids": [row["id"] for row in rows]}
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+
+from models import User
+from auth import get_current_admin_user
+from profiling import profile_store
+
+router = APIRouter(
+    prefix="/admin/profiles",
+    tags=["admin"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("/")
+async def list_profiles(current_user: User = Depends(get_current_admin_user)):
+    return await run_in_threadpool(profile_store.list)
+
+@router.get("/{profile_id}/{kind}")
+async def download_profile(
+    profile_id: str,
+    kind: str,
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Download a stored profile; ``kind`` is ``collapsed`` or ``speedscope``."""
+    path = profile_store.path(profile_id, kind)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    media_type = "application/json" if kind == "speedscope" else "text/plain"
+    return FileResponse(path, media_type=media_type, filename=f"{profile_id}-{path.rsplit('/', 1)[-1]}")
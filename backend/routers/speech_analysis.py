@@ -5,13 +5,15 @@ import base64
 import os
 import json
 import io
-from google.cloud import speech
-from google.cloud.speech import RecognitionConfig, RecognitionAudio
+import threading
+from profiling import run_in_threadpool
 
 from database import get_db
 from models import User
 from schemas import SpeechAnalysisRequest, SpeechAnalysisResponse
 from auth import get_current_active_user
+from admission import admission
+from metrics import stage_timer
 
 router = APIRouter(
     prefix="/speech-analysis",
@@ -19,24 +21,44 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-# Initialize Google Cloud Speech client
-try:
-    speech_client = speech.SpeechClient()
-except Exception as e:
-    print(f"Warning: Google Speech-to-Text client initialization failed: {e}")
-    speech_client = None
+# The Google Cloud Speech client is created on first use (or in warm_up),
+# so importing this router doesn't pull in the gRPC stack.
+_speech_client = None
+_speech_client_initialized = False
+_speech_client_lock = threading.Lock()
+
+def get_speech_client():
+    global _speech_client, _speech_client_initialized
+    if not _speech_client_initialized:
+        with _speech_client_lock:
+            if not _speech_client_initialized:
+                try:
+                    from google.cloud import speech
+                    _speech_client = speech.SpeechClient()
+                except Exception as e:
+                    print(f"Warning: Google Speech-to-Text client initialization failed: {e}")
+                    _speech_client = None
+                _speech_client_initialized = True
+    return _speech_client
+
+def warm_up():
+    get_speech_client()
 
 @router.post("/transcribe", response_model=SpeechAnalysisResponse)
 async def transcribe_audio(
     request: SpeechAnalysisRequest,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    admission_slot: None = Depends(admission("speech"))
 ):
+    speech_client = get_speech_client()
     if not speech_client:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Speech-to-Text service not available"
         )
     
+    from google.cloud.speech import RecognitionConfig, RecognitionAudio
+
     try:
         # Decode the base64 audio
         audio_content = base64.b64decode(request.audio_base64)
@@ -51,8 +73,10 @@ async def transcribe_audio(
             model="default",
         )
         
-        # Send the request to Google Speech-to-Text API
-        response = speech_client.recognize(config=config, audio=audio)
+        # Send the request to Google Speech-to-Text API. The client call blocks,
+        # so it runs on a worker thread to keep the event loop responsive
+        with stage_timer("speech_to_text"):
+            response = await run_in_threadpool(speech_client.recognize, config=config, audio=audio)
         
         transcription = ""
         confidence = 0.0
@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 import uuid
 
-from database import get_db
-from models import User
-from schemas import UserCreate, User as UserSchema, Token
-from auth import authenticate_user, create_access_token, get_password_hash, ACCESS_TOKEN_EXPIRE_MINUTES
+from database import get_async_db
+from models import User, UserProgress
+from schemas import UserCreate, User as UserSchema, Token, UserProgressSummary
+from auth import authenticate_user, create_access_token, get_current_active_user, get_password_hash, ACCESS_TOKEN_EXPIRE_MINUTES
 
 router = APIRouter(
     prefix="/users",
@@ -16,16 +17,16 @@ router = APIRouter(
 )
 
 @router.post("/register", response_model=UserSchema)
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if db_user:
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(User).where(User.email == user.email))
+    if result.scalars().first():
         raise HTTPException(status_code=400, detail="Email already registered")
-    
-    db_username = db.query(User).filter(User.username == user.username).first()
-    if db_username:
+
+    result = await db.execute(select(User).where(User.username == user.username))
+    if result.scalars().first():
         raise HTTPException(status_code=400, detail="Username already taken")
-    
-    hashed_password = get_password_hash(user.password)
+
+    hashed_password = await get_password_hash(user.password)
     db_user = User(
         id=str(uuid.uuid4()),
         email=user.email,
@@ -33,13 +34,13 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
         hashed_password=hashed_password
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 @router.post("/token", response_model=Token)
-def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = authenticate_user(db, form_data.username, form_data.password)
+async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -51,3 +52,22 @@ def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db:
         data={"sub": user.username}, expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
+
+@router.get("/me/progress", response_model=UserProgressSummary)
+async def read_my_progress(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    # Pre-aggregated rows (see progress.py): one indexed lookup, independent of history length
+    result = await db.execute(select(UserProgress).where(UserProgress.user_id == current_user.id))
+    progress = {}
+    for row in result.scalars():
+        if row.count:
+            progress.setdefault(row.interview_type, {})[row.metric] = {
+                "count": row.count,
+                "mean": row.mean,
+                "ewma": row.ewma,
+                "best": row.best,
+                "last": row.last,
+            }
+    return {"progress": progress}
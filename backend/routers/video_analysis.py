@@ -5,16 +5,19 @@ import base64
 import os
 import json
 import io
-import cv2
-import numpy as np
 import tempfile
-import mediapipe as mp
-from deepface import DeepFace
+import uuid
+from fastapi import Query
+from pymongo.errors import PyMongoError
 
 from database import get_db
 from models import User
-from schemas import VideoAnalysisRequest, VideoAnalysisResponse
+from schemas import VideoAnalysisRequest, VideoAnalysisResponse, VideoTimeline
 from auth import get_current_active_user
+from admission import admission
+from metrics import stage_timer, timed_stage
+from profiling import run_in_threadpool
+from timeline import TimelineWriter, query_timeline
 
 router = APIRouter(
     prefix="/video-analysis",
@@ -22,19 +25,47 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-# Initialize MediaPipe Face Mesh
-mp_face_mesh = mp.solutions.face_mesh
-face_mesh = mp_face_mesh.FaceMesh(
-    static_image_mode=False,
-    max_num_faces=1,
-    min_detection_confidence=0.5,
-    min_tracking_confidence=0.5
-)
+# OpenCV, MediaPipe and DeepFace (TensorFlow) are imported and initialized on
+# first use (or in warm_up), so importing this router stays cheap.
+# Analyses run on worker threads and a FaceMesh graph must not be used by two
+# of them at once, so each analysis checks one out of this pool. It grows to
+# the peak number of concurrent analyses, which the "video" admission bounds.
+_face_meshes = []
+
+def _new_face_mesh():
+    import mediapipe as mp
+    return mp.solutions.face_mesh.FaceMesh(
+        static_image_mode=False,
+        max_num_faces=1,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5
+    )
+
+def acquire_face_mesh():
+    try:
+        return _face_meshes.pop()
+    except IndexError:
+        return _new_face_mesh()
+
+def release_face_mesh(face_mesh):
+    _face_meshes.append(face_mesh)
+
+def get_deepface():
+    from deepface import DeepFace
+    return DeepFace
+
+def warm_up():
+    """Load every model the analysis needs so the first request doesn't pay for it."""
+    import cv2  # noqa: F401
+    if not _face_meshes:
+        release_face_mesh(_new_face_mesh())
+    get_deepface().build_model("Emotion")
 
 @router.post("/analyze", response_model=VideoAnalysisResponse)
 async def analyze_video(
     request: VideoAnalysisRequest,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    admission_slot: None = Depends(admission("video"))
 ):
     try:
         # Decode the base64 video
@@ -45,8 +76,13 @@ async def analyze_video(
             temp_video.write(video_bytes)
             temp_video_path = temp_video.name
         
-        # Process the video
-        facial_expressions, eye_contact, posture_score = process_video(temp_video_path)
+        # Process the video, keeping the per-frame timeline in Mongo. It runs on
+        # a worker thread: the event loop stays free, so the admission slot
+        # (not the loop) is what bounds how many analyses run in parallel.
+        timeline = TimelineWriter(analysis_id=str(uuid.uuid4()), user_id=current_user.id)
+        facial_expressions, eye_contact, posture_score = await run_in_threadpool(
+            process_video, temp_video_path, timeline
+        )
         
         # Clean up
         os.unlink(temp_video_path)
@@ -54,7 +90,8 @@ async def analyze_video(
         return VideoAnalysisResponse(
             facial_expressions=facial_expressions,
             eye_contact=eye_contact,
-            posture_score=posture_score
+            posture_score=posture_score,
+            analysis_id=timeline.analysis_id if timeline.written else None
         )
         
     except Exception as e:
@@ -63,6 +100,23 @@ async def analyze_video(
             detail=f"Error analyzing video: {str(e)}"
         )
 
+@router.get("/timeline/{analysis_id}", response_model=VideoTimeline)
+async def get_timeline(
+    analysis_id: str,
+    resolution: float = Query(1.0, ge=0.1, le=60.0, description="Bucket size in seconds"),
+    current_user: User = Depends(get_current_active_user)
+):
+    try:
+        points = await run_in_threadpool(query_timeline, analysis_id, current_user.id, resolution)
+    except PyMongoError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Timeline storage unavailable: {str(e)}"
+        )
+    if not points:
+        raise HTTPException(status_code=404, detail="Timeline not found")
+    return VideoTimeline(analysis_id=analysis_id, resolution=resolution, points=points)
+
 @router.post("/upload-video")
 async def upload_video(
     file: UploadFile = File(...),
@@ -85,8 +139,15 @@ async def upload_video(
             detail=f"Error uploading video: {str(e)}"
         )
 
-def process_video(video_path):
-    """Process video for facial expressions, eye contact, and posture analysis."""
+@timed_stage("video_analysis")
+def process_video(video_path, timeline=None):
+    """Process video for facial expressions, eye contact, and posture analysis.
+
+    If a ``TimelineWriter`` is given, every analysed frame is also recorded
+    as a timeline point."""
+    import cv2
+    face_mesh = acquire_face_mesh()
+    DeepFace = get_deepface()
     try:
         # Open the video file
         cap = cv2.VideoCapture(video_path)
@@ -95,7 +156,7 @@ def process_video(video_path):
             raise ValueError("Could not open video file")
         
         frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
         
         # Setup analysis variables
         emotions = {"angry": 0, "disgust": 0, "fear": 0, "happy": 0, "sad": 0, "surprise": 0, "neutral": 0}
@@ -105,8 +166,9 @@ def process_video(video_path):
         
         # Process every 5th frame to reduce computation
         for i in range(0, frame_count, 5):
-            cap.set(cv2.CAP_PROP_POS_FRAMES, i)
-            ret, frame = cap.read()
+            with stage_timer("video_decode"):
+                cap.set(cv2.CAP_PROP_POS_FRAMES, i)
+                ret, frame = cap.read()
             
             if not ret:
                 break
@@ -117,7 +179,12 @@ def process_video(video_path):
             rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             
             # Face Mesh for eye contact and posture
-            results = face_mesh.process(rgb_frame)
+            with stage_timer("facemesh"):
+                results = face_mesh.process(rgb_frame)
+            
+            eye_contact_score = None
+            posture_score = None
+            frame_emotions = None
             
             if results.multi_face_landmarks:
                 face_landmarks = results.multi_face_landmarks[0]
@@ -135,18 +202,33 @@ def process_video(video_path):
             # Emotion analysis using DeepFace (every 30th frame to reduce computation)
             if i % 30 == 0:
                 try:
-                    analysis = DeepFace.analyze(img_path=frame, actions=['emotion'], enforce_detection=False)
+                    with stage_timer("deepface"):
+                        analysis = DeepFace.analyze(img_path=frame, actions=['emotion'], enforce_detection=False)
                     if isinstance(analysis, list) and len(analysis) > 0:
                         analysis = analysis[0]
                     
                     dominant_emotion = analysis['dominant_emotion']
                     emotions[dominant_emotion] += 1
+                    # DeepFace reports percentages
+                    frame_emotions = {emotion: float(score) / 100 for emotion, score in analysis['emotion'].items()}
                 except Exception as e:
                     print(f"DeepFace error on frame {i}: {e}")
+            
+            if timeline is not None:
+                timeline.add(
+                    t=i / fps,
+                    face_detected=bool(results.multi_face_landmarks),
+                    eye_contact=eye_contact_score,
+                    posture=posture_score,
+                    emotions=frame_emotions
+                )
         
         # Release video capture
         cap.release()
         
+        if timeline is not None:
+            timeline.flush()
+        
         # Calculate final metrics
         total_emotions = sum(emotions.values())
         if total_emotions > 0:
@@ -162,6 +244,8 @@ def process_video(video_path):
     except Exception as e:
         print(f"Error processing video: {e}")
         return {}, 0.0, 0.0
+    finally:
+        release_face_mesh(face_mesh)
 
 def calculate_eye_contact(face_landmarks):
     """Calculate eye contact based on iris position (simplified)"""
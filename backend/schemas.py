@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 # User schemas
@@ -47,6 +47,15 @@ class Interview(InterviewBase):
     class Config:
         orm_mode = True
 
+class InterviewStart(BaseModel):
+    interview_type: str
+    difficulty: Optional[str] = None  # easy, medium, hard; any when omitted
+    num_questions: int = Field(5, ge=1, le=20)
+
+class InterviewPage(BaseModel):
+    items: List[Interview]
+    next_cursor: Optional[str] = None
+
 # Question schemas
 class QuestionBase(BaseModel):
     question_text: str
@@ -63,6 +72,10 @@ class Question(QuestionBase):
     class Config:
         orm_mode = True
 
+class QuestionBulkCreate(BaseModel):
+    interview_id: str
+    questions: List[QuestionBase] = Field(..., min_length=1, max_length=100)
+
 # Answer schemas
 class AnswerBase(BaseModel):
     answer_text: str
@@ -80,6 +93,13 @@ class Answer(AnswerBase):
     class Config:
         orm_mode = True
 
+class AnswerBulkCreate(BaseModel):
+    interview_id: str
+    answers: List[AnswerCreate] = Field(..., min_length=1, max_length=100)
+
+class BulkCreateResponse(BaseModel):
+    ids: List[str]
+
 # Feedback schemas
 class FeedbackBase(BaseModel):
     feedback_text: str
@@ -98,6 +118,26 @@ class Feedback(FeedbackBase):
     class Config:
         orm_mode = True
 
+# Nested interview detail (interview + questions + answers + feedback)
+class QuestionDetail(Question):
+    answers: List[Answer] = []
+
+class InterviewDetail(Interview):
+    questions: List[QuestionDetail] = []
+    feedbacks: List[Feedback] = []
+
+# Progress schemas
+class ProgressMetric(BaseModel):
+    count: int
+    mean: float
+    ewma: Optional[float] = None
+    best: Optional[float] = None
+    last: Optional[float] = None
+
+class UserProgressSummary(BaseModel):
+    # interview_type -> metric (technical, communication, confidence) -> aggregates
+    progress: Dict[str, Dict[str, ProgressMetric]]
+
 # AI Analysis schemas
 class SpeechAnalysisRequest(BaseModel):
     audio_base64: str
@@ -113,3 +153,17 @@ class VideoAnalysisResponse(BaseModel):
     facial_expressions: dict
     eye_contact: float
     posture_score: float
+    analysis_id: Optional[str] = None
+
+class VideoTimelinePoint(BaseModel):
+    t: float
+    samples: int
+    face_detected: float
+    eye_contact: Optional[float] = None
+    posture: Optional[float] = None
+    emotions: Optional[Dict[str, float]] = None
+
+class VideoTimeline(BaseModel):
+    analysis_id: str
+    resolution: float
+    points: List[VideoTimelinePoint]
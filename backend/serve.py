@@ -0,0 +1,182 @@
+"""Production launcher: load the heavy analysis models once, then fork workers.
+
+The master imports the app and runs its warm-up hooks before forking, so
+the read-only model pages (TensorFlow weights, MediaPipe graphs) are
+shared copy-on-write by every worker instead of being loaded N times.
+Workers serve from a socket inherited from the master and are replaced
+when they exit, which makes ``--max-requests`` a graceful recycle:
+
+    python serve.py --workers 4 --max-requests 2000
+
+Signals to the master: SIGTERM/SIGINT shut down gracefully, SIGHUP
+recycles every worker. For local development keep using ``python main.py``.
+"""
+import argparse
+import gc
+import os
+import random
+import signal
+import socket
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Preload-then-fork API server")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))))
+    parser.add_argument("--max-requests", type=int, default=int(os.getenv("MAX_REQUESTS", "0")),
+                        help="recycle a worker after this many requests (0 = never)")
+    parser.add_argument("--max-requests-jitter", type=int, default=int(os.getenv("MAX_REQUESTS_JITTER", "0")),
+                        help="random extra requests per worker so they don't all recycle at once")
+    parser.add_argument("--graceful-timeout", type=int, default=int(os.getenv("GRACEFUL_TIMEOUT", "30")),
+                        help="seconds a worker gets to finish in-flight requests before it is killed")
+    parser.add_argument("--no-preload", action="store_true",
+                        help="don't load models in the master (each worker loads them lazily)")
+    parser.add_argument("--log-level", default=os.getenv("LOG_LEVEL", "info"))
+    return parser.parse_args()
+
+def bind_socket(host, port):
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+def run_worker(app, sock, args):
+    import uvicorn
+
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGHUP, signal.SIG_DFL)
+    random.seed()
+    # The inherited MongoClient's monitor threads did not survive the fork and
+    # its sockets are shared with the master; each worker needs its own client
+    import database
+    database.connect_mongo()
+
+    limit = None
+    if args.max_requests > 0:
+        limit = args.max_requests + random.randint(0, max(args.max_requests_jitter, 0))
+    config = uvicorn.Config(
+        app,
+        limit_max_requests=limit,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        log_level=args.log_level,
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+class Master:
+    def __init__(self, app, sock, args):
+        self.app = app
+        self.sock = sock
+        self.args = args
+        self.workers = {}  # pid -> start time
+        self.shutting_down = False
+
+    def spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                run_worker(self.app, self.sock, self.args)
+            except BaseException as e:
+                print(f"Worker {os.getpid()} crashed: {e}", file=sys.stderr)
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        self.workers[pid] = time.monotonic()
+        print(f"Started worker {pid}")
+
+    def handle_shutdown(self, signum, frame):
+        self.shutting_down = True
+        self.signal_workers(signal.SIGTERM)
+
+    def handle_recycle(self, signum, frame):
+        # Workers exit gracefully and the main loop forks fresh ones
+        self.signal_workers(signal.SIGTERM)
+
+    def signal_workers(self, signum):
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def reap(self):
+        reaped = []
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            started = self.workers.pop(pid, None)
+            if started is not None:
+                reaped.append((pid, started, status))
+        return reaped
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.handle_shutdown)
+        signal.signal(signal.SIGINT, self.handle_shutdown)
+        signal.signal(signal.SIGHUP, self.handle_recycle)
+
+        for _ in range(self.args.workers):
+            self.spawn()
+
+        while not self.shutting_down:
+            for pid, started, status in self.reap():
+                if self.shutting_down:
+                    break
+                print(f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}, replacing it")
+                # Back off a little if workers die right after starting
+                if time.monotonic() - started < 1:
+                    time.sleep(1)
+                self.spawn()
+            time.sleep(0.2)
+
+        deadline = time.monotonic() + self.args.graceful_timeout + 5
+        while self.workers and time.monotonic() < deadline:
+            self.reap()
+            time.sleep(0.2)
+        if self.workers:
+            print(f"Killing {len(self.workers)} worker(s) that did not stop in time")
+            self.signal_workers(signal.SIGKILL)
+            while self.workers:
+                self.reap()
+                time.sleep(0.1)
+        self.sock.close()
+
+def main():
+    args = parse_args()
+    # Loading happens here in the master, not again in each worker's startup hook
+    os.environ["WARM_UP_MODELS"] = "false"
+
+    import main as api
+
+    if not args.no_preload:
+        started = time.perf_counter()
+        api.warm_up_models()
+        print(f"Preloaded models in {time.perf_counter() - started:.1f}s")
+
+    # Pooled DB connections must not be shared across processes
+    from database import engine
+    engine.dispose()
+
+    # Move everything loaded so far out of the GC's reach so collections in the
+    # workers don't touch (and therefore copy) the shared pages
+    gc.collect()
+    gc.freeze()
+
+    sock = bind_socket(args.host, args.port)
+    print(f"Listening on {args.host}:{args.port} with {args.workers} worker(s)")
+    Master(api.app, sock, args).run()
+
+if __name__ == "__main__":
+    main()
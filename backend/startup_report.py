@@ -0,0 +1,91 @@
+"""Measure API cold-start time and memory for each router configuration.
+
+Every configuration is measured in a fresh interpreter so import caches
+don't leak between runs:
+
+    python startup_report.py            # table
+    python startup_report.py --json     # machine-readable
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ALL_OFF = {
+    "ENABLE_AI_FEEDBACK": "false",
+    "ENABLE_SPEECH_ANALYSIS": "false",
+    "ENABLE_VIDEO_ANALYSIS": "false",
+}
+
+CONFIGURATIONS = [
+    ("auth/crud only", ALL_OFF, False),
+    ("+ ai_feedback", {**ALL_OFF, "ENABLE_AI_FEEDBACK": "true"}, False),
+    ("+ speech_analysis", {**ALL_OFF, "ENABLE_SPEECH_ANALYSIS": "true"}, False),
+    ("+ video_analysis", {**ALL_OFF, "ENABLE_VIDEO_ANALYSIS": "true"}, False),
+    ("all routers (lazy models)", {}, False),
+    ("all routers + warm-up", {}, True),
+]
+
+# Runs in the child interpreter; prints one JSON line
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+if {warm_up}:
+    main.warm_up_models()
+done = time.perf_counter()
+print(json.dumps({{
+    "import_seconds": round(imported - start, 3),
+    "warm_up_seconds": round(done - imported, 3),
+    "total_seconds": round(done - start, 3),
+    "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    "modules": len(sys.modules),
+}}))
+"""
+
+def measure(env_overrides, warm_up):
+    env = {**os.environ, **env_overrides, "WARM_UP_MODELS": "false"}
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE.format(warm_up=warm_up)],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr else "failed"}
+    # Router modules may print warnings; the probe result is the last line
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args()
+
+    report = []
+    for name, env_overrides, warm_up in CONFIGURATIONS:
+        result = measure(env_overrides, warm_up)
+        result["configuration"] = name
+        report.append(result)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'configuration':<28}{'import s':>10}{'warm-up s':>11}{'total s':>10}{'peak RSS MB':>13}")
+    for result in report:
+        if "error" in result:
+            print(f"{result['configuration']:<28}  error: {result['error']}")
+            continue
+        print(
+            f"{result['configuration']:<28}{result['import_seconds']:>10.3f}"
+            f"{result['warm_up_seconds']:>11.3f}{result['total_seconds']:>10.3f}"
+            f"{result['peak_rss_mb']:>13.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
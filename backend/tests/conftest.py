@@ -0,0 +1,52 @@
+"""Shared fixtures: the app against a throwaway SQLite database and mongomock.
+
+Run from ``backend``: ``python -m pytest tests``.
+"""
+import os
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+_workdir = tempfile.mkdtemp(prefix="interview-ai-tests-")
+# Must be in place before database.py is imported
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_workdir, 'test.db')}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["MONGO_URI"] = "mongomock://"
+os.environ["PROFILE_SAMPLE_RATE"] = "0"
+os.environ["PROFILE_DIR"] = os.path.join(_workdir, "profiles")
+for flag in ("ENABLE_AI_FEEDBACK", "ENABLE_SPEECH_ANALYSIS", "ENABLE_VIDEO_ANALYSIS"):
+    os.environ[flag] = "false"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+import main
+from database import Base, engine
+
+@pytest.fixture(scope="session")
+def client():
+    Base.metadata.create_all(bind=engine)
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def auth_headers(client):
+    """Registers a fresh user and returns its Authorization header."""
+    def make_user(username=None):
+        username = username or f"user-{uuid.uuid4().hex[:12]}"
+        password = "correct horse battery staple"
+        email = f"{username}@example.com"
+        response = client.post("/users/register", json={
+            "email": email,
+            "username": username,
+            "password": password,
+        })
+        assert response.status_code == 200, response.text
+        # The login form's "username" field carries the email
+        response = client.post("/users/token", data={"username": email, "password": password})
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return make_user
@@ -0,0 +1,45 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+import admission
+
+def test_policy_rejects_zero_rate(monkeypatch):
+    monkeypatch.setenv("ADMISSION_TEST_RATE", "0")
+
+    with pytest.raises(ValueError, match="ADMISSION_TEST_RATE"):
+        admission._policy("test", rate=1.0, burst=1, concurrency=1, max_queue=0, max_wait=1)
+
+def test_policy_rejects_empty_bucket(monkeypatch):
+    monkeypatch.setenv("ADMISSION_TEST_BURST", "0")
+
+    with pytest.raises(ValueError, match="ADMISSION_TEST_BURST"):
+        admission._policy("test", rate=1.0, burst=1, concurrency=1, max_queue=0, max_wait=1)
+
+def test_busy_rejection_does_not_use_up_rate_budget(monkeypatch):
+    policy = admission.AdmissionPolicy(rate=0.001, burst=1, concurrency=1, max_queue=0, max_wait=1)
+    limiter = admission.ConcurrencyLimiter(policy.concurrency, policy.max_queue, policy.max_wait)
+    monkeypatch.setitem(admission.POLICIES, "test", policy)
+    monkeypatch.setitem(admission.limiters, "test", limiter)
+    monkeypatch.setattr(admission, "token_buckets", admission.InMemoryTokenBuckets())
+    admit = admission.admission("test")
+    user = SimpleNamespace(id="user-1")
+
+    async def scenario():
+        limiter.active = 1  # another request holds the only slot
+        with pytest.raises(HTTPException) as busy:
+            await admit(current_user=user).__anext__()
+        limiter.active = 0
+        # The refunded token admits the retry despite the tiny sustained rate
+        slot = admit(current_user=user)
+        await slot.__anext__()
+        await slot.aclose()
+        return busy.value
+
+    busy = asyncio.run(scenario())
+
+    assert busy.status_code == 429
+    assert busy.detail == "Server busy, please retry later"
+    assert limiter.active == 0
@@ -0,0 +1,19 @@
+import asyncio
+
+from auth import get_current_user
+from database import AsyncSessionLocal
+
+def test_get_current_user_ends_its_transaction(client, auth_headers):
+    # Otherwise the request would hold a pooled connection idle in transaction
+    # for as long as the handler runs (admission waits, video analysis, ...)
+    token = auth_headers()["Authorization"].removeprefix("Bearer ")
+
+    async def lookup():
+        async with AsyncSessionLocal() as db:
+            user = await get_current_user(token=token, db=db)
+            return user.username, db.in_transaction()
+
+    username, in_transaction = asyncio.run(lookup())
+
+    assert username.startswith("user-")
+    assert not in_transaction
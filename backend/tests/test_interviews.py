@@ -0,0 +1,87 @@
+def create_interview_with_questions(client, headers):
+    response = client.post("/interviews/", json={"interview_type": "technical"}, headers=headers)
+    assert response.status_code == 200, response.text
+    interview_id = response.json()["id"]
+    response = client.post("/interviews/questions/bulk", json={
+        "interview_id": interview_id,
+        "questions": [
+            {"question_text": "Explain a hash map.", "question_order": 1},
+            {"question_text": "What is a deadlock?", "question_order": 2},
+        ],
+    }, headers=headers)
+    assert response.status_code == 200, response.text
+    return interview_id, response.json()["ids"]
+
+def test_read_interview_full_returns_tree_and_etag(client, auth_headers):
+    headers = auth_headers()
+    interview_id, question_ids = create_interview_with_questions(client, headers)
+    client.post("/interviews/answers/bulk", json={
+        "interview_id": interview_id,
+        "answers": [{"question_id": question_ids[0], "answer_text": "Buckets of keys."}],
+    }, headers=headers)
+
+    response = client.get(f"/interviews/{interview_id}/full", headers=headers)
+
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"].startswith('"')
+    body = response.json()
+    assert body["id"] == interview_id
+    assert [q["question_order"] for q in body["questions"]] == [1, 2]
+    assert [a["answer_text"] for a in body["questions"][0]["answers"]] == ["Buckets of keys."]
+    assert body["questions"][1]["answers"] == []
+
+def test_read_interview_full_not_modified(client, auth_headers):
+    headers = auth_headers()
+    interview_id, _ = create_interview_with_questions(client, headers)
+    etag = client.get(f"/interviews/{interview_id}/full", headers=headers).headers["ETag"]
+
+    response = client.get(f"/interviews/{interview_id}/full", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+def test_read_interview_full_changes_etag_when_tree_changes(client, auth_headers):
+    headers = auth_headers()
+    interview_id, _ = create_interview_with_questions(client, headers)
+    etag = client.get(f"/interviews/{interview_id}/full", headers=headers).headers["ETag"]
+    client.post("/interviews/questions/", json={
+        "interview_id": interview_id, "question_text": "Follow-up?", "question_order": 3,
+    }, headers=headers)
+
+    response = client.get(f"/interviews/{interview_id}/full", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+def test_read_interview_full_hides_other_users_interviews(client, auth_headers):
+    owner, other = auth_headers(), auth_headers()
+    interview_id, _ = create_interview_with_questions(client, owner)
+
+    response = client.get(f"/interviews/{interview_id}/full", headers=other)
+
+    assert response.status_code == 404
+
+def test_read_interviews_pages_through_history_once(client, auth_headers):
+    headers = auth_headers()
+    created = [
+        client.post("/interviews/", json={"interview_type": "behavioral"}, headers=headers).json()["id"]
+        for _ in range(5)
+    ]
+
+    seen, cursor = [], None
+    for _ in range(10):
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/interviews/", params=params, headers=headers).json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert seen == list(reversed(created))
+
+def test_read_interviews_rejects_bad_cursor(client, auth_headers):
+    response = client.get("/interviews/", params={"cursor": "not-a-cursor"}, headers=auth_headers())
+
+    assert response.status_code == 400
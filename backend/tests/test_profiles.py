@@ -0,0 +1,5 @@
+def test_admin_profiles_forbidden_without_configured_admins(client, auth_headers):
+    # Usernames are self-chosen, so claiming "admin" must not grant admin rights
+    response = client.get("/admin/profiles", headers=auth_headers(username="admin"))
+
+    assert response.status_code == 403
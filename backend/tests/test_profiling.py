@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import BackgroundTasks
+
+import main
+import profiling
+
+def busy_worker_call(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+async def busy_background_task(seconds):
+    await profiling.run_in_threadpool(busy_worker_call, seconds)
+
+@main.app.get("/_test/offloaded")
+async def offloaded_endpoint():
+    await profiling.run_in_threadpool(busy_worker_call, 0.2)
+    return {"ok": True}
+
+@main.app.post("/_test/background")
+async def background_endpoint(background_tasks: BackgroundTasks):
+    background_tasks.add_task(profiling.background(busy_background_task), 0.2)
+    return {"ok": True}
+
+@pytest.fixture
+def always_profile(monkeypatch):
+    monkeypatch.setattr(profiling, "sampled", lambda: True)
+
+def collapsed_stacks(profile_id):
+    with open(profiling.profile_store.path(profile_id, "collapsed")) as f:
+        return f.read()
+
+def test_profile_samples_threadpool_callee(client, always_profile):
+    response = client.get("/_test/offloaded")
+
+    assert response.status_code == 200
+    stacks = collapsed_stacks(response.headers["X-Profile-Id"])
+    worker_stacks = [line for line in stacks.splitlines() if line.startswith("<worker thread>")]
+    assert any("busy_worker_call" in line for line in worker_stacks)
+
+def test_background_task_gets_its_own_profile(client, always_profile):
+    response = client.post("/_test/background")
+
+    parent_id = response.headers["X-Profile-Id"]
+    children = [meta for meta in profiling.profile_store.list() if meta.get("parent") == parent_id]
+    assert len(children) == 1
+    assert children[0]["path"] == "busy_background_task"
+    assert "busy_worker_call" in collapsed_stacks(children[0]["id"])
+
+def test_run_in_threadpool_is_plain_outside_profiled_requests():
+    assert asyncio.run(profiling.run_in_threadpool(sum, [1, 2, 3])) == 6
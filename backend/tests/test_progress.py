@@ -0,0 +1,76 @@
+import asyncio
+import uuid
+
+from sqlalchemy import select
+
+import rebuild_progress
+from database import SessionLocal
+from models import Interview, InterviewFeedback, InterviewQuestion, UserProgress
+from routers import ai_feedback
+
+def start_answered_interview(client, headers):
+    interview = client.post("/interviews/", json={"interview_type": "technical"}, headers=headers).json()
+    question_ids = client.post("/interviews/questions/bulk", json={
+        "interview_id": interview["id"],
+        "questions": [{"question_text": "Explain a hash map.", "question_order": 1}],
+    }, headers=headers).json()["ids"]
+    client.post("/interviews/answers/bulk", json={
+        "interview_id": interview["id"],
+        "answers": [{"question_id": question_ids[0], "answer_text": "Buckets of keys."}],
+    }, headers=headers)
+    return interview["id"]
+
+def generate_feedback(interview_id, scores, monkeypatch):
+    """What /ai-feedback/generate does, with the LLM call replaced."""
+    async def fake_generate(interview_context):
+        return "Solid answer.", scores
+    monkeypatch.setattr(ai_feedback, "generate_openai_feedback", fake_generate)
+
+    with SessionLocal() as db:
+        feedback = InterviewFeedback(id=str(uuid.uuid4()), interview_id=interview_id, feedback_text="pending")
+        db.add(feedback)
+        db.commit()
+        interview = feedback.interview
+        questions = db.execute(select(InterviewQuestion).where(InterviewQuestion.interview_id == interview_id)).scalars().all()
+        db.expunge_all()
+    asyncio.run(ai_feedback.process_interview_feedback(feedback.id, interview, questions, interview.user_id))
+    return feedback.id
+
+def progress_rows(user_id):
+    with SessionLocal() as db:
+        rows = db.execute(select(UserProgress).where(UserProgress.user_id == user_id)).scalars().all()
+        return {
+            (row.interview_type, row.metric): (row.count, row.mean, row.ewma, row.best, row.last)
+            for row in rows
+        }
+
+def test_regenerated_feedback_is_counted_once_per_row(client, auth_headers, monkeypatch):
+    headers = auth_headers()
+    interview_id = start_answered_interview(client, headers)
+
+    first = generate_feedback(interview_id, {"technical": 6, "communication": 7, "confidence": 8}, monkeypatch)
+    second = generate_feedback(interview_id, {"technical": 8, "communication": 7, "confidence": 6}, monkeypatch)
+
+    with SessionLocal() as db:
+        scores = {f.id: f.technical_score for f in db.execute(select(InterviewFeedback).where(
+            InterviewFeedback.interview_id == interview_id
+        )).scalars()}
+        user_id = db.get(Interview, interview_id).user_id
+    assert scores == {first: 6, second: 8}
+
+    progress = client.get("/users/me/progress", headers=headers).json()["progress"]
+    assert progress["technical"]["technical"]["count"] == 2
+    assert progress["technical"]["technical"]["mean"] == 7
+    assert progress["technical"]["technical"]["best"] == 8
+    assert progress["technical"]["technical"]["last"] == 8
+
+    live = progress_rows(user_id)
+    with SessionLocal() as db:
+        rebuild_progress.rebuild(db, user_id)
+    assert progress_rows(user_id) == live
+
+def test_progress_is_empty_without_feedback(client, auth_headers):
+    response = client.get("/users/me/progress", headers=auth_headers())
+
+    assert response.status_code == 200
+    assert response.json() == {"progress": {}}
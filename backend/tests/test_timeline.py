@@ -0,0 +1,59 @@
+import asyncio
+from types import SimpleNamespace
+
+import mongomock
+import pytest
+from fastapi import HTTPException
+from pymongo.errors import CollectionInvalid, OperationFailure, ServerSelectionTimeoutError
+
+import timeline
+from routers import video_analysis
+
+class CreateFails(mongomock.Database):
+    """mongomock database whose create_collection raises ``error``."""
+
+    def __init__(self, error):
+        super().__init__(mongomock.MongoClient(), "interview_ai", _store=None)
+        self.error = error
+
+    def create_collection(self, name, **kwargs):
+        raise self.error
+
+def ttl_indexes(db):
+    info = db[timeline.TIMELINE_COLLECTION].index_information()
+    return [name for name, index in info.items() if "expireAfterSeconds" in index]
+
+@pytest.fixture
+def ttl_days(monkeypatch):
+    monkeypatch.setattr(timeline, "TIMELINE_TTL_DAYS", 7)
+
+def test_collection_created_by_another_worker_is_left_alone(ttl_days):
+    db = CreateFails(CollectionInvalid("collection video_timelines already exists"))
+
+    timeline._prepare_collection(db)
+
+    # A TTL index on ts would be rejected by a real time-series collection
+    assert ttl_indexes(db) == []
+
+def test_server_without_time_series_gets_plain_collection(ttl_days):
+    db = CreateFails(OperationFailure("BSON field 'create.timeseries' is an unknown field", code=40415))
+
+    timeline._prepare_collection(db)
+
+    assert ttl_indexes(db) == ["ts_1"]
+
+def test_other_create_failures_propagate(ttl_days):
+    db = CreateFails(OperationFailure("not authorized", code=13))
+
+    with pytest.raises(OperationFailure):
+        timeline._prepare_collection(db)
+
+def test_timeline_endpoint_reports_storage_errors_as_503(monkeypatch):
+    def unavailable(*args):
+        raise ServerSelectionTimeoutError("no servers")
+    monkeypatch.setattr(video_analysis, "query_timeline", unavailable)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(video_analysis.get_timeline("some-id", 1.0, SimpleNamespace(id="user-1")))
+
+    assert error.value.status_code == 503
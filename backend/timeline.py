@@ -0,0 +1,162 @@
+"""Per-frame video analysis timeline stored in MongoDB.
+
+``process_video`` emits one point per analysed frame (landmark-derived
+scores, plus emotion probabilities on the frames DeepFace looks at). Points
+are buffered and written with unordered ``bulk_write`` batches, so a long
+answer costs a handful of round trips. The collection is created as a
+time-series collection where the server supports it (MongoDB 5.0+) and as
+a plain indexed collection otherwise (older servers, mongomock).
+
+A point's offset into the answer is only stored as its ``ts`` timestamp.
+MongoDB 5.x rejects secondary indexes on measurement fields of
+time-series collections, so the indexes cover only ``meta`` fields and
+``ts``.
+"""
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+from pymongo import ASCENDING, InsertOne
+from pymongo.errors import CollectionInvalid, OperationFailure, PyMongoError
+
+import database
+
+TIMELINE_COLLECTION = os.getenv("VIDEO_TIMELINE_COLLECTION", "video_timelines")
+TIMELINE_BATCH_SIZE = int(os.getenv("VIDEO_TIMELINE_BATCH_SIZE", "500"))
+# 0 keeps timelines forever
+TIMELINE_TTL_DAYS = int(os.getenv("VIDEO_TIMELINE_TTL_DAYS", "0"))
+
+# Server error codes for "create does not know the timeseries option" (pre-5.0)
+_NO_TIMESERIES_CODES = {40415, 72}  # unknown BSON field, InvalidOptions
+
+EMOTIONS = ("angry", "disgust", "fear", "happy", "sad", "surprise", "neutral")
+
+_prepared = set()
+_prepare_lock = threading.Lock()
+
+def get_timeline_collection():
+    # Looked up on every call so a swapped client (tests, benchmarks) is honoured
+    db = database.mongo_db
+    key = (id(db), TIMELINE_COLLECTION)
+    if key not in _prepared:
+        with _prepare_lock:
+            if key not in _prepared:
+                _prepare_collection(db)
+                _prepared.add(key)
+    return db[TIMELINE_COLLECTION]
+
+def _prepare_collection(db):
+    if TIMELINE_COLLECTION not in db.list_collection_names():
+        options = {}
+        if TIMELINE_TTL_DAYS > 0:
+            options["expireAfterSeconds"] = TIMELINE_TTL_DAYS * 86400
+        try:
+            db.create_collection(
+                TIMELINE_COLLECTION,
+                timeseries={"timeField": "ts", "metaField": "meta", "granularity": "seconds"},
+                **options,
+            )
+        except CollectionInvalid:
+            # Another worker created it first, with the same options
+            pass
+        except (OperationFailure, NotImplementedError) as e:
+            if isinstance(e, OperationFailure) and e.code not in _NO_TIMESERIES_CODES:
+                raise
+            # No time-series support (older server, mongomock); a regular
+            # collection with the same shape works
+            if TIMELINE_TTL_DAYS > 0:
+                db[TIMELINE_COLLECTION].create_index("ts", expireAfterSeconds=options["expireAfterSeconds"])
+    collection = db[TIMELINE_COLLECTION]
+    collection.create_index([("meta.analysis_id", ASCENDING), ("ts", ASCENDING)])
+    collection.create_index([("meta.user_id", ASCENDING), ("ts", ASCENDING)])
+
+class TimelineWriter:
+    """Buffers timeline points for one analysis and writes them in batches.
+
+    Storage problems never fail the analysis itself: the first error is
+    logged, the writer marks itself ``failed`` and drops further points.
+    """
+
+    def __init__(self, analysis_id, user_id, batch_size=TIMELINE_BATCH_SIZE, collection=None):
+        self.analysis_id = analysis_id
+        self.user_id = user_id
+        self.batch_size = batch_size
+        self.collection = collection
+        self.started_at = datetime.now(timezone.utc)
+        self.written = 0
+        self.failed = False
+        self._buffer = []
+
+    def add(self, t, face_detected, eye_contact=None, posture=None, emotions=None):
+        if self.failed:
+            return
+        point = {
+            "ts": self.started_at + timedelta(seconds=t),
+            "meta": {"analysis_id": self.analysis_id, "user_id": self.user_id},
+            "face_detected": face_detected,
+        }
+        if eye_contact is not None:
+            point["eye_contact"] = eye_contact
+        if posture is not None:
+            point["posture"] = posture
+        if emotions:
+            point["emotions"] = emotions
+        self._buffer.append(InsertOne(point))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer or self.failed:
+            self._buffer.clear()
+            return
+        try:
+            collection = self.collection if self.collection is not None else get_timeline_collection()
+            collection.bulk_write(self._buffer, ordered=False)
+            self.written += len(self._buffer)
+        except PyMongoError as e:
+            print(f"Warning: could not store video timeline {self.analysis_id}: {e}")
+            self.failed = True
+        finally:
+            self._buffer.clear()
+
+def query_timeline(analysis_id, user_id, resolution):
+    """Timeline downsampled to ``resolution``-second buckets, averaged in Mongo."""
+    match = {"meta.analysis_id": analysis_id, "meta.user_id": user_id}
+    collection = get_timeline_collection()
+    first = collection.find_one(match, projection={"ts": 1}, sort=[("ts", ASCENDING)])
+    if first is None:
+        return []
+
+    # Seconds since the first point; date subtraction yields milliseconds
+    offset = {"$divide": [{"$subtract": ["$ts", first["ts"]]}, 1000]}
+    group = {
+        "_id": {"$subtract": [offset, {"$mod": [offset, resolution]}]},
+        "samples": {"$sum": 1},
+        "face_detected": {"$avg": {"$cond": ["$face_detected", 1, 0]}},
+        "eye_contact": {"$avg": "$eye_contact"},
+        "posture": {"$avg": "$posture"},
+    }
+    for emotion in EMOTIONS:
+        group[f"emotion_{emotion}"] = {"$avg": f"$emotions.{emotion}"}
+
+    pipeline = [
+        {"$match": match},
+        {"$group": group},
+        {"$sort": {"_id": 1}},
+    ]
+    points = []
+    for bucket in collection.aggregate(pipeline):
+        emotions = {
+            emotion: bucket[f"emotion_{emotion}"]
+            for emotion in EMOTIONS
+            if bucket.get(f"emotion_{emotion}") is not None
+        }
+        points.append({
+            "t": bucket["_id"],
+            "samples": bucket["samples"],
+            "face_detected": bucket["face_detected"],
+            "eye_contact": bucket.get("eye_contact"),
+            "posture": bucket.get("posture"),
+            "emotions": emotions or None,
+        })
+    return points
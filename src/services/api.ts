@@ -91,9 +91,11 @@ export const authService = {
 
 // Interview services
 export const interviewService = {
-  getInterviews: async () => {
+  // Returns { items, next_cursor }; pass next_cursor back to load the next page
+  getInterviews: async (cursor?: string) => {
     try {
-      const response = await authFetch('/interviews/');
+      const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+      const response = await authFetch(`/interviews/${query}`);
       
       if (!response.ok) {
         throw new Error('Failed to fetch interviews');